@@ -228,7 +228,6 @@ function Initialize-Project {
     Start-Services
     Write-Host "⏳ Waiting for services to be ready..." -ForegroundColor Yellow
     Start-Sleep -Seconds 15
-    Create-Migration -Description "initial_tables"
     Apply-Migrations
     Write-Host "✅ Project initialized successfully!" -ForegroundColor Green
     Write-Host "🌐 API: http://localhost:8000" -ForegroundColor Cyan
@@ -14,6 +14,8 @@ from workout_api.contrib.models import Base
 from workout_api.atleta.models import AtletaModel
 from workout_api.categorias.models import CategoriaModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.estatisticas.models import AtletaResumoModel
+from workout_api.jobs.models import JobModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
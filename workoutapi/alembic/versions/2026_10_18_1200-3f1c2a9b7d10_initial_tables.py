@@ -0,0 +1,86 @@
+"""initial tables
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9b7d10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_table(
+        'categorias',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('nome'),
+    )
+    op.create_index('ix_categorias_created_at_id', 'categorias', ['created_at', 'id'], unique=False)
+
+    op.create_table(
+        'centro_treinamento',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('endereco', sa.String(length=100), nullable=False),
+        sa.Column('proprietario', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('nome'),
+    )
+    op.create_index('ix_centro_treinamento_created_at_id', 'centro_treinamento', ['created_at', 'id'], unique=False)
+
+    op.create_table(
+        'atletas',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('cpf', sa.String(length=11), nullable=False),
+        sa.Column('idade', sa.Integer(), nullable=False),
+        sa.Column('peso', sa.Float(), nullable=False),
+        sa.Column('altura', sa.Float(), nullable=False),
+        sa.Column('sexo', sa.String(length=1), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('categoria_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('centro_treinamento_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['categoria_id'], ['categorias.id']),
+        sa.ForeignKeyConstraint(['centro_treinamento_id'], ['centro_treinamento.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('cpf'),
+    )
+    op.create_index('ix_atletas_categoria_id', 'atletas', ['categoria_id'], unique=False)
+    op.create_index('ix_atletas_centro_treinamento_id', 'atletas', ['centro_treinamento_id'], unique=False)
+    op.create_index('ix_atletas_created_at_id', 'atletas', ['created_at', 'id'], unique=False)
+    op.create_index('ix_atletas_nome', 'atletas', ['nome'], unique=False)
+    op.create_index(
+        'ix_atletas_nome_trgm', 'atletas', ['nome'], unique=False,
+        postgresql_using='gin', postgresql_ops={'nome': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_using='gin')
+    op.drop_index('ix_atletas_nome', table_name='atletas')
+    op.drop_index('ix_atletas_created_at_id', table_name='atletas')
+    op.drop_index('ix_atletas_centro_treinamento_id', table_name='atletas')
+    op.drop_index('ix_atletas_categoria_id', table_name='atletas')
+    op.drop_table('atletas')
+    op.drop_index('ix_centro_treinamento_created_at_id', table_name='centro_treinamento')
+    op.drop_table('centro_treinamento')
+    op.drop_index('ix_categorias_created_at_id', table_name='categorias')
+    op.drop_table('categorias')
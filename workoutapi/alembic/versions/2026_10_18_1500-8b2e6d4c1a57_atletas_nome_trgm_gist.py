@@ -0,0 +1,33 @@
+"""atletas nome trigram index as gist
+
+Revision ID: 8b2e6d4c1a57
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e6d4c1a57'
+down_revision: Union[str, None] = '3f1c2a9b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GiST atende o ILIKE e também o ORDER BY por distância (KNN) de GET /atleta/search
+    op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_using='gin')
+    op.create_index(
+        'ix_atletas_nome_trgm', 'atletas', ['nome'], unique=False,
+        postgresql_using='gist', postgresql_ops={'nome': 'gist_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_using='gist')
+    op.create_index(
+        'ix_atletas_nome_trgm', 'atletas', ['nome'], unique=False,
+        postgresql_using='gin', postgresql_ops={'nome': 'gin_trgm_ops'},
+    )
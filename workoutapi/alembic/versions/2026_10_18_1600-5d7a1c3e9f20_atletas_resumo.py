@@ -0,0 +1,119 @@
+"""atletas_resumo summary table maintained by triggers
+
+Revision ID: 5d7a1c3e9f20
+Revises: 8b2e6d4c1a57
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7a1c3e9f20'
+down_revision: Union[str, None] = '8b2e6d4c1a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Agrega um conjunto de atletas (tabela ou transition table) por (categoria, centro).
+# As faixas de IMC seguem IMC_FAIXAS em workout_api/estatisticas/controller.py
+AGREGADOS = """
+    SELECT categoria_id, centro_treinamento_id,
+           {sinal} count(*),
+           {sinal} sum(idade),
+           {sinal} sum(peso),
+           {sinal} sum(altura),
+           {sinal} sum(peso / (altura * altura)),
+           {sinal} count(*) FILTER (WHERE peso / (altura * altura) < 18.5),
+           {sinal} count(*) FILTER (WHERE peso / (altura * altura) >= 18.5 AND peso / (altura * altura) < 25),
+           {sinal} count(*) FILTER (WHERE peso / (altura * altura) >= 25 AND peso / (altura * altura) < 30),
+           {sinal} count(*) FILTER (WHERE peso / (altura * altura) >= 30)
+      FROM {origem}
+     GROUP BY categoria_id, centro_treinamento_id
+"""
+
+UPSERT = """
+    INSERT INTO atletas_resumo AS r (
+        categoria_id, centro_treinamento_id, total, soma_idade, soma_peso, soma_altura, soma_imc,
+        imc_abaixo_do_peso, imc_normal, imc_sobrepeso, imc_obesidade
+    )
+    {agregados}
+    ON CONFLICT (categoria_id, centro_treinamento_id) DO UPDATE SET
+        total = r.total + EXCLUDED.total,
+        soma_idade = r.soma_idade + EXCLUDED.soma_idade,
+        soma_peso = r.soma_peso + EXCLUDED.soma_peso,
+        soma_altura = r.soma_altura + EXCLUDED.soma_altura,
+        soma_imc = r.soma_imc + EXCLUDED.soma_imc,
+        imc_abaixo_do_peso = r.imc_abaixo_do_peso + EXCLUDED.imc_abaixo_do_peso,
+        imc_normal = r.imc_normal + EXCLUDED.imc_normal,
+        imc_sobrepeso = r.imc_sobrepeso + EXCLUDED.imc_sobrepeso,
+        imc_obesidade = r.imc_obesidade + EXCLUDED.imc_obesidade
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'atletas_resumo',
+        sa.Column('categoria_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('centro_treinamento_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('soma_idade', sa.Float(), nullable=False),
+        sa.Column('soma_peso', sa.Float(), nullable=False),
+        sa.Column('soma_altura', sa.Float(), nullable=False),
+        sa.Column('soma_imc', sa.Float(), nullable=False),
+        sa.Column('imc_abaixo_do_peso', sa.Integer(), nullable=False),
+        sa.Column('imc_normal', sa.Integer(), nullable=False),
+        sa.Column('imc_sobrepeso', sa.Integer(), nullable=False),
+        sa.Column('imc_obesidade', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['categoria_id'], ['categorias.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['centro_treinamento_id'], ['centro_treinamento.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('categoria_id', 'centro_treinamento_id'),
+    )
+    op.create_index(
+        'ix_atletas_resumo_centro_treinamento_id', 'atletas_resumo', ['centro_treinamento_id'], unique=False
+    )
+
+    # Triggers por statement com transition tables: um INSERT em lote de 1000 atletas gera
+    # um único upsert por (categoria, centro), não 1000
+    op.execute(f"""
+        CREATE FUNCTION atletas_resumo_aplicar() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                {UPSERT.format(agregados=AGREGADOS.format(sinal='-', origem='antigos'))};
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                {UPSERT.format(agregados=AGREGADOS.format(sinal='', origem='novos'))};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_resumo_insert AFTER INSERT ON atletas
+        REFERENCING NEW TABLE AS novos
+        FOR EACH STATEMENT EXECUTE FUNCTION atletas_resumo_aplicar()
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_resumo_update AFTER UPDATE ON atletas
+        REFERENCING OLD TABLE AS antigos NEW TABLE AS novos
+        FOR EACH STATEMENT EXECUTE FUNCTION atletas_resumo_aplicar()
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_resumo_delete AFTER DELETE ON atletas
+        REFERENCING OLD TABLE AS antigos
+        FOR EACH STATEMENT EXECUTE FUNCTION atletas_resumo_aplicar()
+    """)
+
+    # Carga inicial com os atletas já existentes
+    op.execute(UPSERT.format(agregados=AGREGADOS.format(sinal='', origem='atletas')))
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER atletas_resumo_delete ON atletas')
+    op.execute('DROP TRIGGER atletas_resumo_update ON atletas')
+    op.execute('DROP TRIGGER atletas_resumo_insert ON atletas')
+    op.execute('DROP FUNCTION atletas_resumo_aplicar()')
+    op.drop_index('ix_atletas_resumo_centro_treinamento_id', table_name='atletas_resumo')
+    op.drop_table('atletas_resumo')
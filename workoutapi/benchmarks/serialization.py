@@ -0,0 +1,115 @@
+"""Benchmark da serialização das listagens (sem banco).
+
+Monta uma página de N atletas como os controllers fazem e compara:
+
+- fastapi_padrao: o caminho anterior; o FastAPI revalida o retorno pelo response_model
+  (serialize_response) e codifica com o JSONResponse padrão (json da stdlib);
+- schema_response: o schema já montado é devolvido como Response e serializado direto
+  pelo pydantic-core (workout_api.contrib.responses).
+
+Uso (a partir de workoutapi/):
+
+    python -m benchmarks.serialization --rows 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000, help='Atletas por listagem')
+    parser.add_argument('--repeat', type=int, default=20, help='Listagens serializadas por caminho')
+    parser.add_argument('--output', default='bench_results_serialization.json')
+    return parser.parse_args(argv)
+
+
+def build_rows(total: int) -> list[SimpleNamespace]:
+    # Objetos com os mesmos atributos dos models, como chegam do SELECT com joinedload
+    agora = datetime.utcnow()
+    categoria = SimpleNamespace(id=uuid.uuid4(), nome='Scale', created_at=agora, updated_at=agora)
+    centro = SimpleNamespace(
+        id=uuid.uuid4(), nome='CT King', endereco='Rua das Flores, 123', proprietario='Joao',
+        created_at=agora, updated_at=agora,
+    )
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(), nome=f'Atleta {i}', cpf=f'{i:011d}', idade=25, peso=70.5, altura=1.75, sexo='M',
+            created_at=agora, updated_at=agora, categoria=categoria, centro_treinamento=centro,
+        )
+        for i in range(total)
+    ]
+
+
+async def measure(render: Callable[[], Any], repeat: int) -> list[float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await render()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from workout_api.atleta.schemas import AtletaOut
+    from workout_api.contrib.responses import schema_response
+    from workout_api.contrib.schemas import Page
+
+    rows = build_rows(args.rows)
+    response_field = create_model_field(name='Response_query', type_=Page[AtletaOut], mode='serialization')
+
+    def build_page() -> Page[AtletaOut]:
+        return Page[AtletaOut](items=[AtletaOut.model_validate(row) for row in rows], next_cursor=None)
+
+    async def fastapi_padrao() -> bytes:
+        content = await serialize_response(field=response_field, response_content=build_page())
+        return JSONResponse(content).body
+
+    async def schema_response_path() -> bytes:
+        return schema_response(build_page()).body
+
+    # Os dois caminhos precisam gerar o mesmo documento
+    assert json.loads(await fastapi_padrao()) == json.loads(await schema_response_path())
+
+    results = {}
+    for name, render in (('fastapi_padrao', fastapi_padrao), ('schema_response', schema_response_path)):
+        print(f'  {name}...', file=sys.stderr)
+        durations = await measure(render, args.repeat)
+        media = statistics.mean(durations)
+        results[name] = {
+            'ms_per_list': round(media * 1000, 2),
+            'p95_ms': round(sorted(durations)[int(0.95 * (len(durations) - 1))] * 1000, 2),
+            'lists_per_second': round(1 / media, 2),
+            'rows_per_second': round(args.rows / media),
+        }
+
+    return {
+        'meta': {'timestamp': datetime.utcnow().isoformat(), 'rows': args.rows, 'repeat': args.repeat},
+        'results': results,
+    }
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    report = asyncio.run(main(args))
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+
+    for name, result in report['results'].items():
+        print(
+            f"{name:16} {result['ms_per_list']:8.2f} ms/lista  p95={result['p95_ms']:8.2f}ms  "
+            f"{result['lists_per_second']:7.2f} listas/s  {result['rows_per_second']:9} linhas/s"
+        )
@@ -0,0 +1,86 @@
+"""Fixtures dos testes da API.
+
+Os testes rodam contra TEST_DB_URL ou, na falta dela, um SQLite temporário. DB_URL não é
+usada de propósito: as tabelas são recriadas a cada teste. As settings são lidas no import
+do workout_api, por isso o ambiente é ajustado antes dele.
+"""
+import os
+import tempfile
+
+_tmpdir = tempfile.mkdtemp(prefix='workout_api_tests_')
+os.environ['DB_URL'] = os.environ.get('TEST_DB_URL', f'sqlite+aiosqlite:///{_tmpdir}/primary.sqlite')
+os.environ['DB_READ_URLS'] = ''
+os.environ['DB_POOL_WARMUP'] = '0'
+os.environ['DB_MAX_CONCURRENT_PER_CLIENT'] = '0'
+os.environ['DB_CONCURRENCY_WAIT_SECONDS'] = '30'
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+os.environ['JOBS_ENABLED'] = 'false'
+os.environ['SQL_SLOW_QUERY_MS'] = '0'
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import workout_api.contrib.repository.models  # noqa: F401 (registra as tabelas no metadata)
+from workout_api.configs import database
+from workout_api.configs.database import ReadReplicaRouter, engine
+from workout_api.contrib.cache import categoria_cache, centro_treinamento_cache
+from workout_api.contrib.models import BaseModel
+from workout_api.main import app
+
+
+async def create_schema(target: AsyncEngine) -> None:
+    async with target.begin() as connection:
+        if connection.dialect.name == 'postgresql':
+            await connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        await connection.run_sync(BaseModel.metadata.drop_all)
+        await connection.run_sync(BaseModel.metadata.create_all)
+
+
+@pytest.fixture
+async def db():
+    """Engine primário com as tabelas recriadas e os caches de referência vazios."""
+    await create_schema(engine)
+    categoria_cache.clear()
+    centro_treinamento_cache.clear()
+    yield engine
+    # O pool pertence ao event loop do teste; o próximo teste abre conexões novas
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(db):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://testserver') as client:
+        yield client
+
+
+@pytest.fixture
+async def replica_router(db, tmp_path, monkeypatch):
+    """Troca as réplicas configuradas por um segundo SQLite com o mesmo schema, vazio."""
+    router = ReadReplicaRouter([f'sqlite+aiosqlite:///{tmp_path}/replica.sqlite'], retry_seconds=30)
+    await create_schema(router.engines[0])
+    monkeypatch.setattr(database, 'read_router', router)
+    yield router
+    await router.engines[0].dispose()
+
+
+CATEGORIA = {'nome': 'Scale'}
+CENTRO_TREINAMENTO = {'nome': 'CT King', 'endereco': 'Rua das Flores, 123', 'proprietario': 'Joao'}
+
+
+def atleta_payload(indice: int, **campos) -> dict:
+    return {
+        'nome': f'Atleta {indice}', 'cpf': f'{indice:011d}', 'idade': 25, 'peso': 75.5, 'altura': 1.7,
+        'sexo': 'M', 'categoria': CATEGORIA['nome'], 'centro_treinamento': CENTRO_TREINAMENTO['nome'],
+        **campos,
+    }
+
+
+@pytest.fixture
+async def referencias(client):
+    """Cria a categoria e o centro de treinamento usados pelos atletas de atleta_payload."""
+    categoria = await client.post('/categoria/', json=CATEGORIA)
+    centro_treinamento = await client.post('/centro_treinamento/', json=CENTRO_TREINAMENTO)
+    assert categoria.status_code == 201 and centro_treinamento.status_code == 201
+    return categoria.json(), centro_treinamento.json()
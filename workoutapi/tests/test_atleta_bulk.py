@@ -0,0 +1,29 @@
+"""Inserção de atletas em lotes (POST /atleta/bulk e job atletas_import)."""
+from unittest import mock
+
+from tests.conftest import atleta_payload
+from workout_api.atleta.service import inserir_lote
+from workout_api.configs.database import async_session
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
+
+
+async def test_cpf_repetido_no_lote(client, referencias):
+    resposta = await client.post('/atleta/bulk', json=[atleta_payload(1), atleta_payload(1, nome='Outro Nome')])
+
+    assert resposta.status_code == 200
+    assert [r['status'] for r in resposta.json()['resultados']] == ['criado', 'erro']
+    assert 'CPF repetido' in resposta.json()['resultados'][1]['detail']
+
+
+async def test_lote_com_falha_nao_bloqueia_cpf_nos_seguintes(referencias):
+    cpfs_vistos: set[str] = set()
+    async with async_session() as session:
+        uow = UnitOfWork(session)
+        with mock.patch.object(uow, 'commit', side_effect=RuntimeError('falha no commit')):
+            primeiro = await inserir_lote(uow, [(1, atleta_payload(1))], cpfs_vistos)
+        segundo = await inserir_lote(uow, [(2, atleta_payload(1))], cpfs_vistos)
+        terceiro = await inserir_lote(uow, [(3, atleta_payload(1))], cpfs_vistos)
+
+    assert primeiro[0].status == 'erro' and 'erro ao inserir' in primeiro[0].detail
+    assert segundo[0].status == 'criado'
+    assert terceiro[0].status == 'erro' and 'CPF repetido' in terceiro[0].detail
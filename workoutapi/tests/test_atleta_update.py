@@ -0,0 +1,34 @@
+"""PATCH de atletas: campos omitidos ficam como estão, null explícito é rejeitado."""
+import pytest
+
+from tests.conftest import atleta_payload
+
+
+@pytest.fixture
+async def atleta(client, referencias):
+    resposta = await client.post('/atleta/', json=atleta_payload(1))
+    assert resposta.status_code == 201
+    return resposta.json()
+
+
+async def test_patch_parcial(client, atleta):
+    resposta = await client.patch(f"/atleta/{atleta['id']}", json={'idade': 31})
+
+    assert resposta.status_code == 200
+    assert resposta.json()['idade'] == 31
+    assert resposta.json()['nome'] == atleta['nome']
+
+
+@pytest.mark.parametrize('campo', ['nome', 'idade', 'peso', 'altura'])
+async def test_patch_com_null_explicito(client, atleta, campo):
+    resposta = await client.patch(f"/atleta/{atleta['id']}", json={campo: None})
+
+    assert resposta.status_code == 422
+    assert (await client.get(f"/atleta/{atleta['id']}")).json()[campo] == atleta[campo]
+
+
+async def test_bulk_patch_com_null_explicito(client, atleta):
+    resposta = await client.patch('/atleta/bulk', json={'filtro': {'ids': [atleta['id']]}, 'valores': {'peso': None}})
+
+    assert resposta.status_code == 422
+    assert resposta.json()['detail'][0]['loc'] == ['body', 'valores', 'peso']
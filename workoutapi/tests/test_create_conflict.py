@@ -0,0 +1,34 @@
+"""Criações concorrentes com a mesma chave única: uma vence, as demais recebem 409."""
+import asyncio
+from collections import Counter
+
+import pytest
+
+from tests.conftest import CATEGORIA, CENTRO_TREINAMENTO, atleta_payload
+
+CONCORRENCIA = 20
+
+
+async def post_concorrente(client, url: str, payload: dict) -> Counter:
+    respostas = await asyncio.gather(*(client.post(url, json=payload) for _ in range(CONCORRENCIA)))
+    return Counter(resposta.status_code for resposta in respostas)
+
+
+@pytest.mark.parametrize('url, payload', [
+    ('/categoria/', CATEGORIA),
+    ('/centro_treinamento/', CENTRO_TREINAMENTO),
+])
+async def test_referencia_duplicada_concorrente(client, url, payload):
+    status = await post_concorrente(client, url, payload)
+
+    assert status == {201: 1, 409: CONCORRENCIA - 1}
+    pagina = (await client.get(url)).json()
+    assert [item['nome'] for item in pagina['items']] == [payload['nome']]
+
+
+async def test_atleta_duplicado_concorrente(client, referencias):
+    status = await post_concorrente(client, '/atleta/', atleta_payload(1))
+
+    assert status == {201: 1, 409: CONCORRENCIA - 1}
+    pagina = (await client.get('/atleta/')).json()
+    assert [item['cpf'] for item in pagina['items']] == [atleta_payload(1)['cpf']]
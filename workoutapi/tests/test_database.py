@@ -0,0 +1,28 @@
+"""Ciclo de vida dos engines no startup do worker."""
+from workout_api.configs import database
+
+
+async def abrir_e_devolver(engine) -> None:
+    async with engine.connect():
+        pass
+
+
+async def test_start_engines_mantem_pool_no_mesmo_processo(db):
+    await abrir_e_devolver(db)
+    pool = db.pool
+
+    await database.start_engines()
+
+    assert db.pool is pool
+    assert pool.checkedin() == 1
+
+
+async def test_start_engines_troca_pool_herdado_do_fork(db, monkeypatch):
+    await abrir_e_devolver(db)
+    pool = db.pool
+    monkeypatch.setattr(database, '_engines_pid', -1)
+
+    await database.start_engines()
+
+    assert db.pool is not pool
+    assert db.pool.checkedin() == 0
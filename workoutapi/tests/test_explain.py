@@ -0,0 +1,83 @@
+"""Planos das consultas de listagem: cada uma precisa usar o índice criado para ela.
+
+Só roda no Postgres (TEST_DB_URL); o SQLite não tem os mesmos índices nem o mesmo planejador.
+Os statements são os que as rotas realmente executam, capturados no engine. Com as tabelas
+quase vazias o planejador preferiria o scan sequencial, por isso ele é desligado: o plano mostra
+o índice que seria usado e, sem um índice adequado, continua sendo um Seq Scan.
+"""
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import atleta_payload
+from workout_api.configs.database import engine
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != 'postgresql', reason='EXPLAIN dos índices só no Postgres')
+
+
+@pytest.fixture
+async def atletas(client, referencias):
+    for indice in range(3):
+        resposta = await client.post('/atleta/', json=atleta_payload(indice, nome=f'Joana Silva {indice}'))
+        assert resposta.status_code == 201
+
+
+@pytest.fixture
+def capturar(client, db):
+    """Executa a requisição e devolve o SELECT em atletas que ela emitiu, com os parâmetros."""
+    async def capturar(url: str, **params) -> tuple[str, tuple]:
+        executados = []
+
+        def guardar(conn, cursor, statement, parameters, *_):
+            if statement.lstrip().upper().startswith('SELECT') and 'FROM atletas' in statement:
+                executados.append((statement, parameters))
+
+        event.listen(db.sync_engine, 'before_cursor_execute', guardar)
+        try:
+            resposta = await client.get(url, params=params)
+        finally:
+            event.remove(db.sync_engine, 'before_cursor_execute', guardar)
+        assert resposta.status_code == 200
+        assert executados
+        return executados[-1]
+    return capturar
+
+
+async def explain(db, statement: str, parameters) -> str:
+    async with db.connect() as connection:
+        await connection.exec_driver_sql('ANALYZE atletas')
+        await connection.exec_driver_sql('SET enable_seqscan = off')
+        result = await connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+        return '\n'.join(linha for linha, in result)
+
+
+async def test_listagem_usa_indice_da_paginacao(db, atletas, capturar):
+    plano = await explain(db, *await capturar('/atleta/'))
+
+    assert 'ix_atletas_created_at_id' in plano, plano
+
+
+async def test_pagina_seguinte_usa_indice_da_paginacao(db, client, atletas, capturar):
+    cursor = (await client.get('/atleta/', params={'limit': 1})).json()['next_cursor']
+    plano = await explain(db, *await capturar('/atleta/', limit=1, cursor=cursor))
+
+    assert 'ix_atletas_created_at_id' in plano, plano
+
+
+async def test_filtro_por_categoria_usa_indice(db, atletas, capturar):
+    plano = await explain(db, *await capturar('/atleta/', categoria='Scale'))
+
+    # Tanto a FK indexada quanto a ordem da paginação (com o filtro aplicado) evitam o Seq Scan
+    assert 'ix_atletas_categoria_id' in plano or 'ix_atletas_created_at_id' in plano, plano
+    assert 'Seq Scan on atletas' not in plano, plano
+
+
+async def test_busca_por_nome_usa_trigram(db, atletas, capturar):
+    plano = await explain(db, *await capturar('/atleta/search', q='silva'))
+
+    assert 'ix_atletas_nome_trgm' in plano, plano
+
+
+async def test_busca_por_cpf_usa_indice_unico(db, atletas, capturar):
+    plano = await explain(db, *await capturar('/atleta/search', q='000'))
+
+    assert 'atletas_cpf_key' in plano, plano
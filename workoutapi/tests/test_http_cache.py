@@ -0,0 +1,17 @@
+"""Requisições condicionais: o 304 repete os headers de cache da resposta completa."""
+import pytest
+
+from tests.conftest import atleta_payload
+
+
+@pytest.mark.parametrize('url', ['/atleta/', '/atleta/?formato=compacto', '/categoria/'])
+async def test_not_modified_mantem_headers(client, referencias, url):
+    assert (await client.post('/atleta/', json=atleta_payload(1))).status_code == 201
+    completa = await client.get(url)
+
+    condicional = await client.get(url, headers={'If-None-Match': completa.headers['etag']})
+
+    assert condicional.status_code == 304
+    assert condicional.content == b''
+    for header in ('etag', 'cache-control', 'vary'):
+        assert condicional.headers.get(header) == completa.headers.get(header), header
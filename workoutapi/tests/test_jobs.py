@@ -0,0 +1,43 @@
+"""Reserva de jobs: o limite de concorrência vale para todos os processos juntos."""
+from sqlalchemy import update
+
+from workout_api.configs.database import async_session
+from workout_api.jobs.models import JobModel
+from workout_api.jobs.worker import JobWorkerPool
+
+
+def criar_pool(concurrency: int) -> JobWorkerPool:
+    # Só a reserva é exercitada: sem start(), os workers não rodam
+    pool = JobWorkerPool(concurrency=concurrency, poll_seconds=1, stale_seconds=300, shutdown_timeout=1)
+    pool.session_factory = async_session
+    return pool
+
+
+async def enfileirar(quantidade: int) -> None:
+    async with async_session() as session:
+        session.add_all(JobModel(tipo='atletas_export', params={}) for _ in range(quantidade))
+        await session.commit()
+
+
+async def test_limite_global_entre_pools(db):
+    await enfileirar(3)
+    # Dois processos com JOBS_CONCURRENCY=2: juntos reservam só dois jobs
+    pools = [criar_pool(2), criar_pool(2)]
+
+    reservados = [await pool._claim() for pool in (*pools, *pools)]
+
+    assert sum(job is not None for job in reservados) == 2
+
+
+async def test_reserva_volta_quando_um_job_termina(db):
+    await enfileirar(2)
+    pool = criar_pool(1)
+    primeiro = await pool._claim()
+    assert await pool._claim() is None
+
+    async with async_session() as session:
+        await session.execute(update(JobModel).where(JobModel.id == primeiro[0]).values(status='concluido'))
+        await session.commit()
+
+    segundo = await pool._claim()
+    assert segundo is not None and segundo[0] != primeiro[0]
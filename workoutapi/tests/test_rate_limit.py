@@ -0,0 +1,63 @@
+"""Regras do rate limit e o limite de requisições simultâneas ao banco."""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from workout_api.contrib.rate_limit import DatabaseConcurrencyLimiter, RateLimit, RateLimitRule
+
+BULK = RateLimitRule('POST', '/atleta/bulk', RateLimit(rate=1, burst=5))
+
+
+@pytest.mark.parametrize('method, path, esperado', [
+    ('POST', '/atleta/bulk', True),
+    ('POST', '/atleta/bulk/', True),
+    ('POST', '/atleta/bulk-delete', False),
+    ('POST', '/atleta/bulkx', False),
+    ('PATCH', '/atleta/bulk', False),
+])
+def test_regra_casa_por_segmento(method, path, esperado):
+    assert BULK.matches(method, path) is esperado
+
+
+def test_regra_com_barra_final():
+    regra = RateLimitRule('POST', '/jobs/', RateLimit(rate=1, burst=5))
+
+    assert regra.matches('POST', '/jobs/')
+    assert regra.matches('POST', '/jobs/123')
+    assert not regra.matches('POST', '/jobsx')
+
+
+async def test_timeout_devolve_a_vaga():
+    limiter = DatabaseConcurrencyLimiter(limit=1, per_client=0, wait=0.01)
+
+    async with limiter.slot('a'):
+        with pytest.raises(HTTPException) as erro:
+            async with limiter.slot('b'):
+                pass
+        assert erro.value.status_code == 503
+
+    # Nenhuma vaga ficou presa pela tentativa que expirou
+    async with limiter.slot('c'):
+        assert limiter.active == 1
+    assert limiter.active == 0
+    assert not limiter._semaphore.locked()
+
+
+async def test_cancelamento_na_espera_nao_prende_a_vaga():
+    limiter = DatabaseConcurrencyLimiter(limit=1, per_client=0, wait=5)
+
+    async def esperar():
+        async with limiter.slot('b'):
+            pass
+
+    async with limiter.slot('a'):
+        tarefa = asyncio.create_task(esperar())
+        await asyncio.sleep(0)
+    # A vaga foi liberada e a tarefa que esperava é cancelada antes de rodar
+    tarefa.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await tarefa
+
+    assert not limiter._semaphore.locked()
+    assert limiter._por_cliente == {}
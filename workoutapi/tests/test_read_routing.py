@@ -0,0 +1,62 @@
+"""Roteamento de leituras: GETs vão para a réplica, escritas para o primário."""
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import CATEGORIA
+from workout_api.configs import database
+from workout_api.configs.database import ReadReplicaRouter
+
+
+@pytest.fixture
+def record_statements():
+    """Devolve os statements executados por um engine; os listeners saem no teardown."""
+    listeners = []
+
+    def record(target) -> list[str]:
+        executados: list[str] = []
+
+        def count_statement(conn, cursor, statement, *_):
+            executados.append(statement)
+
+        event.listen(target.sync_engine, 'before_cursor_execute', count_statement)
+        listeners.append((target.sync_engine, count_statement))
+        return executados
+
+    yield record
+    for sync_engine, count_statement in listeners:
+        event.remove(sync_engine, 'before_cursor_execute', count_statement)
+
+
+async def test_leituras_na_replica_e_escritas_no_primario(client, replica_router, record_statements):
+    primario = record_statements(database.engine)
+    replica = record_statements(replica_router.engines[0])
+
+    criada = await client.post('/categoria/', json=CATEGORIA)
+    assert criada.status_code == 201
+    assert primario and not replica
+
+    primario.clear()
+    for url in ('/categoria/', '/centro_treinamento/', '/atleta/'):
+        resposta = await client.get(url)
+        assert resposta.status_code == 200
+        # A réplica não recebeu o INSERT: a listagem vazia mostra de onde a leitura veio
+        assert resposta.json()['items'] == []
+    assert replica and not primario
+
+    replica.clear()
+    atualizada = await client.patch(f"/categoria/{criada.json()['id']}", json={'nome': 'Elite'})
+    assert atualizada.status_code == 200
+    removida = await client.delete(f"/categoria/{criada.json()['id']}")
+    assert removida.status_code == 204
+    assert primario and not replica
+
+
+async def test_replica_fora_do_ar_cai_no_primario(client, db, monkeypatch):
+    router = ReadReplicaRouter(['sqlite+aiosqlite:////nonexistent/replica.sqlite'], retry_seconds=30)
+    monkeypatch.setattr(database, 'read_router', router)
+
+    assert (await client.post('/categoria/', json=CATEGORIA)).status_code == 201
+    resposta = await client.get('/categoria/')
+
+    assert [item['nome'] for item in resposta.json()['items']] == [CATEGORIA['nome']]
+    assert not router.is_healthy(0)
@@ -0,0 +1,36 @@
+"""Cache de categorias e centros: só leituras do primário o preenchem."""
+from tests.conftest import CATEGORIA
+from workout_api.configs.database import async_session, read_session
+from workout_api.contrib.cache import categoria_cache
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
+
+
+async def criar_categoria(session) -> str:
+    uow = UnitOfWork(session)
+    categoria = await uow.categorias.create(CATEGORIA)
+    await uow.commit()
+    return categoria.id
+
+
+async def test_leitura_da_replica_nao_preenche_cache(replica_router):
+    async with replica_router.session_factories[0]() as session:
+        id = await criar_categoria(session)
+
+    async with read_session() as session:
+        encontradas = await UnitOfWork(session).categorias.by_ids([id])
+        por_nome = await UnitOfWork(session).categorias.by_nomes([CATEGORIA['nome']])
+
+    assert encontradas[id].nome == por_nome[CATEGORIA['nome']].nome == CATEGORIA['nome']
+    assert categoria_cache.get_by_id(id) is None
+    assert categoria_cache.get_by_nome(CATEGORIA['nome']) is None
+
+
+async def test_leitura_do_primario_preenche_cache(db):
+    async with async_session() as session:
+        id = await criar_categoria(session)
+
+    async with async_session() as session:
+        await UnitOfWork(session).categorias.by_ids([id])
+
+    assert categoria_cache.get_by_id(id).nome == CATEGORIA['nome']
+    assert categoria_cache.get_by_nome(CATEGORIA['nome']).id == id
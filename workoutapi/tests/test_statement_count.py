@@ -0,0 +1,52 @@
+"""Quantidade de statements SQL por rota de atleta; a listagem não pode voltar a ser N+1."""
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import atleta_payload
+
+ATLETAS = 5
+
+
+@pytest.fixture
+def statements(db):
+    """Statements executados pelo engine primário, como o contador de benchmarks/run.py."""
+    executados: list[str] = []
+
+    def count_statement(conn, cursor, statement, *_):
+        executados.append(statement)
+
+    event.listen(db.sync_engine, 'before_cursor_execute', count_statement)
+    yield executados
+    event.remove(db.sync_engine, 'before_cursor_execute', count_statement)
+
+
+@pytest.fixture
+async def atletas(client, referencias):
+    criados = []
+    for indice in range(ATLETAS):
+        resposta = await client.post('/atleta/', json=atleta_payload(indice))
+        assert resposta.status_code == 201
+        criados.append(resposta.json())
+    return criados
+
+
+@pytest.mark.parametrize('method, url, kwargs, esperado', [
+    ('GET', '/atleta/', {}, 1),
+    ('GET', '/atleta/{id}', {}, 1),
+    ('PATCH', '/atleta/{id}', {'json': {'nome': 'Novo Nome', 'idade': 30}}, 1),
+])
+async def test_statements_por_rota(client, atletas, statements, method, url, kwargs, esperado):
+    statements.clear()
+    resposta = await client.request(method, url.format(id=atletas[-1]['id']), **kwargs)
+
+    assert resposta.status_code == 200
+    assert len(statements) == esperado, statements
+
+
+async def test_listagem_traz_relacionamentos(client, atletas, statements):
+    statements.clear()
+    pagina = (await client.get('/atleta/')).json()
+
+    assert len(pagina['items']) == ATLETAS
+    assert all(item['categoria']['nome'] and item['centro_treinamento']['nome'] for item in pagina['items'])
+    assert len(statements) == 1
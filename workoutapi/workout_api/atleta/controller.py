@@ -1,18 +1,74 @@
-from datetime import datetime
-from uuid import uuid4
-from fastapi import APIRouter, Body, HTTPException, status
+import json
+from typing import Any, AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
-from workout_api.atleta.schemas import AtletaIn, AtletaOut, AtletaUpdate
+from workout_api.atleta.schemas import (
+    AtletaBulkAfetadosOut, AtletaBulkDeleteIn, AtletaBulkFiltro, AtletaBulkOut, AtletaBulkResultado,
+    AtletaBulkUpdateIn, AtletaIn, AtletaOut, AtletaSearchOut, AtletasCompactoOut, AtletaUpdate,
+)
 from workout_api.atleta.models import AtletaModel
-from workout_api.categorias.models import CategoriaModel
-from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.atleta.service import BULK_BATCH_SIZE, atleta_out, export_chunks, inserir_lote
 
-from workout_api.contrib.dependencies import DatabaseDependency
-from sqlalchemy.future import select
+from workout_api.contrib.batch import in_order
+from workout_api.contrib.dependencies import PaginationDependency, ReadUnitOfWorkDependency, UnitOfWorkDependency
+from workout_api.contrib.http_cache import conditional_response, make_etag
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
+from workout_api.contrib.responses import schema_response
+from workout_api.contrib.schemas import BatchGetIn, BatchGetOut, Page
+from sqlalchemy.exc import IntegrityError
 
 api_router = APIRouter()
 
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+# Busca ranqueada não passa deste número de resultados (offset + limit)
+SEARCH_MAX_RESULTS = 1000
+# Campos aceitos em ?fields=, na ordem em que aparecem na resposta
+ATLETA_CAMPOS = (
+    'id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo',
+    'categoria', 'centro_treinamento', 'created_at', 'updated_at',
+)
+ATLETA_RELACOES = {'categoria': 'categoria_id', 'centro_treinamento': 'centro_treinamento_id'}
+# Accept que seleciona o formato compacto da listagem (o mesmo que ?formato=compacto)
+COMPACT_MEDIA_TYPE = 'application/vnd.workoutapi.compact+json'
+
+
+def _campos_selecionados(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    if fields is None:
+        return None
+    pedidos = {campo.strip() for campo in fields.split(',') if campo.strip()}
+    invalidos = pedidos - set(ATLETA_CAMPOS)
+    if not pedidos or invalidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Campos inválidos: {", ".join(sorted(invalidos)) or fields}. Campos disponíveis: {", ".join(ATLETA_CAMPOS)}'
+        )
+    return tuple(campo for campo in ATLETA_CAMPOS if campo in pedidos)
+
+
+def _colunas(campos: tuple[str, ...]) -> list[str]:
+    # Só as colunas pedidas, mais id/created_at (cursor) e updated_at (ETag); relações viram a FK
+    colunas = ['id', 'created_at', 'updated_at']
+    for campo in campos:
+        coluna = ATLETA_RELACOES.get(campo, campo)
+        if coluna not in colunas:
+            colunas.append(coluna)
+    return colunas
+
+
+def _atleta_etag_parts(atleta: AtletaModel) -> tuple:
+    # Inclui as relações, pois elas vão embutidas na resposta
+    return (
+        atleta.id, atleta.updated_at,
+        atleta.categoria.id, atleta.categoria.updated_at,
+        atleta.centro_treinamento.id, atleta.centro_treinamento.updated_at,
+    )
+
+
+
+
 @api_router.post(
     '/', 
     summary='Criar um novo atleta',
@@ -20,15 +76,13 @@ api_router = APIRouter()
     response_model=AtletaOut
 )
 async def post(
-    db_session: DatabaseDependency, 
+    uow: UnitOfWorkDependency, 
     atleta_in: AtletaIn = Body(...)
 ):
     categoria_nome = atleta_in.categoria
     centro_treinamento_nome = atleta_in.centro_treinamento
 
-    categoria = (await db_session.execute(
-        select(CategoriaModel).filter_by(nome=categoria_nome))
-    ).scalars().first()
+    categoria = (await uow.categorias.by_nomes({categoria_nome})).get(categoria_nome)
     
     if not categoria:
         raise HTTPException(
@@ -36,9 +90,7 @@ async def post(
             detail=f'A categoria {categoria_nome} não foi encontrada.'
         )
     
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(nome=centro_treinamento_nome))
-    ).scalars().first()
+    centro_treinamento = (await uow.centros_treinamento.by_nomes({centro_treinamento_nome})).get(centro_treinamento_nome)
     
     if not centro_treinamento:
         raise HTTPException(
@@ -46,101 +98,329 @@ async def post(
             detail=f'O centro de treinamento {centro_treinamento_nome} não foi encontrado.'
         )
     
-    # Verificar se CPF já existe
-    cpf_exists = (await db_session.execute(
-        select(AtletaModel).filter_by(cpf=atleta_in.cpf))
-    ).scalars().first()
-    
-    if cpf_exists:
+    # INSERT ... ON CONFLICT (cpf) DO NOTHING RETURNING: um round trip, sem SELECT do CPF
+    # antes nem refresh/re-select depois; as relações já vieram do cache
+    valores = atleta_in.model_dump(exclude={'categoria', 'centro_treinamento'})
+    valores.update(categoria_id=categoria.id, centro_treinamento_id=centro_treinamento.id)
+    try:
+        atleta = await uow.atletas.insert(valores, conflict=AtletaModel.cpf)
+        await uow.commit()
+    except IntegrityError:
+        # Categoria ou centro removidos depois de resolvidos (chave estrangeira)
+        await uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail='A categoria ou o centro de treinamento foi removido durante a criação do atleta'
+        )
+    except Exception:
+        await uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail='Ocorreu um erro ao inserir os dados no banco'
+        )
+
+    if not atleta:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, 
             detail=f'Já existe um atleta cadastrado com o CPF: {atleta_in.cpf}'
         )
-    
-    try:
-        atleta_id = uuid4()
-        atleta_model = AtletaModel(
-            id=atleta_id,
-            nome=atleta_in.nome,
-            cpf=atleta_in.cpf,
-            idade=atleta_in.idade,
-            peso=atleta_in.peso,
-            altura=atleta_in.altura,
-            sexo=atleta_in.sexo,
-            categoria_id=categoria.id,
-            centro_treinamento_id=centro_treinamento.id,
-            created_at=datetime.utcnow()
-        )
-        
-        db_session.add(atleta_model)
-        await db_session.commit()
-        await db_session.refresh(atleta_model)
-        
-        # Carregar as relações para retornar
-        atleta_with_relations = (await db_session.execute(
-            select(AtletaModel)
-            .filter_by(id=atleta_id)
-        )).scalars().first()
-        
-        return AtletaOut(
-            id=atleta_with_relations.id,
-            nome=atleta_with_relations.nome,
-            cpf=atleta_with_relations.cpf,
-            idade=atleta_with_relations.idade,
-            peso=atleta_with_relations.peso,
-            altura=atleta_with_relations.altura,
-            sexo=atleta_with_relations.sexo,
-            created_at=atleta_with_relations.created_at,
-            updated_at=atleta_with_relations.updated_at,
-            categoria=categoria,
-            centro_treinamento=centro_treinamento
+
+    return schema_response(atleta_out(atleta, categoria, centro_treinamento), status_code=status.HTTP_201_CREATED)
+
+
+@api_router.post(
+    '/bulk',
+    summary='Criar atletas em lote (JSON array ou NDJSON)',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBulkOut,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {'schema': {'type': 'array', 'items': AtletaIn.model_json_schema()}},
+                'application/x-ndjson': {'schema': {'type': 'string'}},
+            },
+        }
+    },
+)
+async def bulk(request: Request, uow: UnitOfWorkDependency) -> AtletaBulkOut:
+    resultados: list[AtletaBulkResultado] = []
+    cpfs_vistos: set[str] = set()
+    lote: list[tuple[int, Any]] = []
+
+    async for linha, item in _bulk_items(request):
+        lote.append((linha, item))
+        if len(lote) >= BULK_BATCH_SIZE:
+            resultados += await inserir_lote(uow, lote, cpfs_vistos)
+            lote = []
+    if lote:
+        resultados += await inserir_lote(uow, lote, cpfs_vistos)
+
+    criados = sum(1 for resultado in resultados if resultado.status == 'criado')
+    return schema_response(AtletaBulkOut(criados=criados, erros=len(resultados) - criados, resultados=resultados))
+
+
+@api_router.post(
+    '/batch-get',
+    summary='Consulta vários Atletas pelo id',
+    status_code=status.HTTP_200_OK,
+    response_model=BatchGetOut[AtletaOut],
+)
+async def batch_get(uow: ReadUnitOfWorkDependency, batch: BatchGetIn = Body(...)) -> BatchGetOut[AtletaOut]:
+    # Um único SELECT para todos os ids, com categoria e centro no mesmo statement (joinedload)
+    atletas = await uow.atletas.get_many(batch.ids)
+    items, missing = in_order(batch.ids, {id: atleta_out(atleta) for id, atleta in atletas.items()})
+    return schema_response(BatchGetOut[AtletaOut](items=items, missing=missing))
+
+
+def _bulk_filtro(uow: UnitOfWork, filtro: AtletaBulkFiltro) -> list[Any]:
+    condicoes = uow.atletas.condicoes(filtro.ids, filtro.categoria_id, filtro.centro_treinamento_id)
+
+    # Sem critério o statement alcançaria a tabela inteira
+    if not condicoes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Informe ids, categoria_id ou centro_treinamento_id no filtro.'
         )
-        
-    except Exception as e:
-        await db_session.rollback()
+    return condicoes
+
+
+@api_router.patch(
+    '/bulk',
+    summary='Editar vários Atletas por ids ou filtro',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBulkAfetadosOut,
+)
+async def bulk_patch(uow: UnitOfWorkDependency, bulk_in: AtletaBulkUpdateIn = Body(...)) -> AtletaBulkAfetadosOut:
+    condicoes = _bulk_filtro(uow, bulk_in.filtro)
+    valores = bulk_in.valores.model_dump(exclude_none=True, exclude={'categoria', 'centro_treinamento'})
+
+    categoria_nome = bulk_in.valores.categoria
+    if categoria_nome is not None:
+        categoria = (await uow.categorias.by_nomes({categoria_nome})).get(categoria_nome)
+        if not categoria:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'A categoria {categoria_nome} não foi encontrada.'
+            )
+        valores['categoria_id'] = categoria.id
+
+    centro_treinamento_nome = bulk_in.valores.centro_treinamento
+    if centro_treinamento_nome is not None:
+        centro_treinamento = (await uow.centros_treinamento.by_nomes({centro_treinamento_nome})).get(centro_treinamento_nome)
+        if not centro_treinamento:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'O centro de treinamento {centro_treinamento_nome} não foi encontrado.'
+            )
+        valores['centro_treinamento_id'] = centro_treinamento.id
+
+    if not valores:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
-            detail='Ocorreu um erro ao inserir os dados no banco'
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Informe ao menos um campo em valores.'
         )
 
+    # Um único UPDATE ... WHERE ... RETURNING id, sem carregar os atletas na sessão
+    ids = [atleta.id for atleta in await uow.atletas.update_where(condicoes, valores, returning=[AtletaModel.id])]
+    await uow.commit()
+
+    return schema_response(AtletaBulkAfetadosOut(afetados=len(ids), ids=ids))
+
+
+@api_router.post(
+    '/bulk-delete',
+    summary='Deletar vários Atletas por ids ou filtro',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBulkAfetadosOut,
+)
+async def bulk_delete(uow: UnitOfWorkDependency, bulk_in: AtletaBulkDeleteIn = Body(...)) -> AtletaBulkAfetadosOut:
+    # DELETE ... WHERE ... RETURNING id em uma transação; os triggers de atletas_resumo
+    # são por statement, então rodam uma vez para o lote todo
+    condicoes = _bulk_filtro(uow, bulk_in.filtro)
+    ids = [atleta.id for atleta in await uow.atletas.delete_where(condicoes, returning=[AtletaModel.id])]
+    await uow.commit()
+
+    return schema_response(AtletaBulkAfetadosOut(afetados=len(ids), ids=ids))
+
+
+async def _bulk_items(request: Request) -> AsyncIterator[tuple[int, Any]]:
+    content_type = request.headers.get('content-type', '')
+
+    if 'ndjson' not in content_type:
+        try:
+            itens = json.loads(await request.body())
+        except ValueError:
+            itens = None
+        if not isinstance(itens, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='O corpo deve ser uma lista JSON de atletas ou NDJSON'
+            )
+        for linha, item in enumerate(itens, start=1):
+            yield linha, item
+        return
+
+    # NDJSON: processa o corpo conforme chega, sem carregá-lo inteiro
+    linha = 0
+    buffer = b''
+    async for chunk in request.stream():
+        buffer += chunk
+        *linhas, buffer = buffer.split(b'\n')
+        for raw in linhas:
+            if raw.strip():
+                linha += 1
+                yield linha, raw
+    if buffer.strip():
+        yield linha + 1, buffer
+
 
 @api_router.get(
     '/', 
     summary='Consultar todos os Atletas',
     status_code=status.HTTP_200_OK,
-    response_model=list[AtletaOut],
+    response_model=Page[AtletaOut],
 )
-async def query(db_session: DatabaseDependency) -> list[AtletaOut]:
-    atletas = (await db_session.execute(
-        select(AtletaModel)
-    )).scalars().all()
-    
-    result = []
-    for atleta in atletas:
-        # Buscar categoria e centro de treinamento
-        categoria = (await db_session.execute(
-            select(CategoriaModel).filter_by(id=atleta.categoria_id)
-        )).scalars().first()
-        
-        centro_treinamento = (await db_session.execute(
-            select(CentroTreinamentoModel).filter_by(id=atleta.centro_treinamento_id)
-        )).scalars().first()
-        
-        result.append(AtletaOut(
-            id=atleta.id,
-            nome=atleta.nome,
-            cpf=atleta.cpf,
-            idade=atleta.idade,
-            peso=atleta.peso,
-            altura=atleta.altura,
-            sexo=atleta.sexo,
-            created_at=atleta.created_at,
-            updated_at=atleta.updated_at,
-            categoria=categoria,
-            centro_treinamento=centro_treinamento
-        ))
+async def query(
+    request: Request,
+    response: Response,
+    uow: ReadUnitOfWorkDependency,
+    page: PaginationDependency,
+    nome: Optional[str] = Query(None, description="Filtrar pelo nome do atleta"),
+    cpf: Optional[str] = Query(None, description="Filtrar pelo CPF do atleta"),
+    categoria: Optional[str] = Query(None, description="Filtrar pelo nome da categoria"),
+    centro_treinamento: Optional[str] = Query(None, description="Filtrar pelo nome do centro de treinamento"),
+    formato: Optional[Literal['completo', 'compacto']] = Query(
+        None,
+        description=f"compacto: atletas com categoria_id/centro_treinamento_id e as categorias e centros da página "
+                    f"uma vez só (o mesmo que Accept: {COMPACT_MEDIA_TYPE})",
+    ),
+    fields: Optional[str] = Query(None, description="Campos dos atletas separados por vírgula (ex.: nome,cpf)"),
+) -> Page[AtletaOut]:
+    if formato is None:
+        formato = 'compacto' if COMPACT_MEDIA_TYPE in request.headers.get('accept', '') else 'completo'
+    campos = _campos_selecionados(fields)
+    response.headers['Vary'] = 'Accept'
+
+    projetada = formato == 'compacto' or campos is not None
+    stmt = uow.atletas.select_colunas(_colunas(campos or ATLETA_CAMPOS)) if projetada else uow.atletas.select()
+    stmt = uow.atletas.filtrar(stmt, nome, cpf, categoria, centro_treinamento)
+
+    if projetada:
+        return await _query_projetada(
+            request, response, uow, page, stmt, campos or ATLETA_CAMPOS, formato == 'compacto'
+        )
+
+    atletas, next_cursor = await uow.atletas.page(stmt, page)
+
+    etag = make_etag([next_cursor, *(part for atleta in atletas for part in _atleta_etag_parts(atleta))])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     
-    return result
+    return schema_response(Page[AtletaOut](
+        items=[atleta_out(atleta) for atleta in atletas],
+        next_cursor=next_cursor
+    ), response)
+
+
+async def _query_projetada(
+    request: Request,
+    response: Response,
+    uow: UnitOfWork,
+    page: PaginationDependency,
+    stmt: Any,
+    campos: tuple[str, ...],
+    compacto: bool,
+) -> Response:
+    # Listagem com ?fields= e/ou no formato compacto: SELECT só das colunas, sem join; as
+    # categorias e centros referenciados vêm do cache (ou de um SELECT por tabela)
+    linhas, next_cursor = await uow.atletas.page(stmt, page, scalars=False)
+
+    categorias = await uow.categorias.by_ids(
+        linha.categoria_id for linha in linhas
+    ) if 'categoria' in campos else {}
+    centros_treinamento = await uow.centros_treinamento.by_ids(
+        linha.centro_treinamento_id for linha in linhas
+    ) if 'centro_treinamento' in campos else {}
+
+    referencias = sorted([*categorias.values(), *centros_treinamento.values()], key=lambda ref: str(ref.id))
+    etag = make_etag([
+        compacto, *campos, next_cursor,
+        *(part for linha in linhas for part in (linha.id, linha.updated_at)),
+        *(part for ref in referencias for part in (ref.id, ref.updated_at)),
+    ])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    por_relacao = {'categoria': categorias, 'centro_treinamento': centros_treinamento}
+    items = []
+    for linha in linhas:
+        item = {}
+        for campo in campos:
+            coluna = ATLETA_RELACOES.get(campo)
+            if coluna is None:
+                item[campo] = getattr(linha, campo)
+            elif compacto:
+                item[coluna] = getattr(linha, coluna)
+            else:
+                item[campo] = por_relacao[campo][getattr(linha, coluna)]
+        items.append(item)
+
+    if compacto:
+        return schema_response(AtletasCompactoOut(
+            items=items,
+            categorias=categorias,
+            centros_treinamento=centros_treinamento,
+            next_cursor=next_cursor
+        ), response)
+    return schema_response(Page[dict[str, Any]](items=items, next_cursor=next_cursor), response)
+
+
+@api_router.get(
+    '/search',
+    summary='Buscar Atletas por parte do nome ou prefixo do CPF',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaSearchOut,
+)
+async def search(
+    uow: ReadUnitOfWorkDependency,
+    q: str = Query(..., min_length=3, max_length=100, description="Parte do nome ou início do CPF (só dígitos)"),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT, description="Quantidade máxima de registros"),
+    offset: int = Query(0, ge=0, lt=SEARCH_MAX_RESULTS, description="Registros a pular"),
+) -> AtletaSearchOut:
+    q = q.strip()
+    limit = min(limit, SEARCH_MAX_RESULTS - offset)
+    atletas = await uow.atletas.search(q, offset, limit + 1)
+
+    next_offset = None
+    if len(atletas) > limit:
+        atletas = atletas[:limit]
+        if offset + limit < SEARCH_MAX_RESULTS:
+            next_offset = offset + limit
+
+    return schema_response(AtletaSearchOut(
+        items=[atleta_out(atleta) for atleta in atletas],
+        next_offset=next_offset
+    ))
+
+
+@api_router.get(
+    '/export',
+    summary='Exportar todos os Atletas (NDJSON ou CSV)',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export(
+    format: Literal['ndjson', 'csv'] = Query('ndjson', description="Formato do arquivo exportado"),
+) -> StreamingResponse:
+    media_type = 'application/x-ndjson' if format == 'ndjson' else 'text/csv'
+    return StreamingResponse(
+        export_chunks(format),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="atletas.{format}"'},
+    )
 
 
 @api_router.get(
@@ -149,39 +429,20 @@ async def query(db_session: DatabaseDependency) -> list[AtletaOut]:
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
 )
-async def get(id: UUID4, db_session: DatabaseDependency) -> AtletaOut:
-    atleta = (
-        await db_session.execute(select(AtletaModel).filter_by(id=id))
-    ).scalars().first()
+async def get(id: UUID4, request: Request, response: Response, uow: ReadUnitOfWorkDependency) -> AtletaOut:
+    atleta = await uow.atletas.get(id)
 
     if not atleta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Atleta não encontrado no id: {id}'
         )
+
+    not_modified = conditional_response(request, response, make_etag(_atleta_etag_parts(atleta)))
+    if not_modified:
+        return not_modified
     
-    # Buscar categoria e centro de treinamento
-    categoria = (await db_session.execute(
-        select(CategoriaModel).filter_by(id=atleta.categoria_id)
-    )).scalars().first()
-    
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(id=atleta.centro_treinamento_id)
-    )).scalars().first()
-    
-    return AtletaOut(
-        id=atleta.id,
-        nome=atleta.nome,
-        cpf=atleta.cpf,
-        idade=atleta.idade,
-        peso=atleta.peso,
-        altura=atleta.altura,
-        sexo=atleta.sexo,
-        created_at=atleta.created_at,
-        updated_at=atleta.updated_at,
-        categoria=categoria,
-        centro_treinamento=centro_treinamento
-    )
+    return schema_response(atleta_out(atleta), response)
 
 
 @api_router.patch(
@@ -190,46 +451,28 @@ async def get(id: UUID4, db_session: DatabaseDependency) -> AtletaOut:
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
 )
-async def patch(id: UUID4, db_session: DatabaseDependency, atleta_up: AtletaUpdate = Body(...)) -> AtletaOut:
-    atleta = (
-        await db_session.execute(select(AtletaModel).filter_by(id=id))
-    ).scalars().first()
+async def patch(id: UUID4, uow: UnitOfWorkDependency, atleta_up: AtletaUpdate = Body(...)) -> AtletaOut:
+    atleta_update = atleta_up.model_dump(exclude_unset=True)
+    if not atleta_update:
+        # Nada a alterar: devolve o atleta como está, sem UPDATE
+        atleta = await uow.atletas.get(id)
+        categoria = centro_treinamento = None
+    else:
+        # UPDATE ... RETURNING em vez de SELECT + flush; as relações vêm do cache (ou de
+        # um SELECT por tabela), ainda na mesma transação
+        atleta = await uow.atletas.update(id, atleta_update)
+        if atleta:
+            categoria = await uow.categorias.by_id(atleta.categoria_id)
+            centro_treinamento = await uow.centros_treinamento.by_id(atleta.centro_treinamento_id)
+            await uow.commit()
 
     if not atleta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Atleta não encontrado no id: {id}'
         )
-    
-    atleta_update = atleta_up.model_dump(exclude_unset=True)
-    for key, value in atleta_update.items():
-        setattr(atleta, key, value)
-
-    await db_session.commit()
-    await db_session.refresh(atleta)
 
-    # Buscar categoria e centro de treinamento para retorno
-    categoria = (await db_session.execute(
-        select(CategoriaModel).filter_by(id=atleta.categoria_id)
-    )).scalars().first()
-    
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(id=atleta.centro_treinamento_id)
-    )).scalars().first()
-
-    return AtletaOut(
-        id=atleta.id,
-        nome=atleta.nome,
-        cpf=atleta.cpf,
-        idade=atleta.idade,
-        peso=atleta.peso,
-        altura=atleta.altura,
-        sexo=atleta.sexo,  
-        created_at=atleta.created_at,
-        updated_at=atleta.updated_at,
-        categoria=categoria,
-        centro_treinamento=centro_treinamento
-    )
+    return schema_response(atleta_out(atleta, categoria, centro_treinamento))
 
 
 @api_router.delete(
@@ -237,16 +480,14 @@ async def patch(id: UUID4, db_session: DatabaseDependency, atleta_up: AtletaUpda
     summary='Deletar um Atleta pelo id',
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete(id: UUID4, db_session: DatabaseDependency) -> None:
-    atleta = (
-        await db_session.execute(select(AtletaModel).filter_by(id=id))
-    ).scalars().first()
+async def delete(id: UUID4, uow: UnitOfWorkDependency) -> None:
+    # DELETE ... RETURNING id: um round trip em vez de SELECT + DELETE
+    atleta = await uow.atletas.delete(id, returning=[AtletaModel.id])
 
     if not atleta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Atleta não encontrado no id: {id}'
         )
-    
-    await db_session.delete(atleta)
-    await db_session.commit()
\ No newline at end of file
+
+    await uow.commit()
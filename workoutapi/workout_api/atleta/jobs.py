@@ -0,0 +1,61 @@
+import asyncio
+import os
+from typing import Any
+
+from sqlalchemy import func, select
+
+from workout_api.atleta.service import BULK_BATCH_SIZE, export_chunks, inserir_lote
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletasExportParams, AtletasImportParams
+from workout_api.configs.settings import settings
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
+from workout_api.jobs.registry import JobContext, register_job
+
+
+@register_job('atletas_import', AtletasImportParams)
+async def importar_atletas(context: JobContext, params: AtletasImportParams) -> dict[str, Any]:
+    """Mesma inserção em lotes do POST /atleta/bulk, reportando o progresso a cada lote."""
+    total = len(params.atletas)
+    await context.progresso(0, total)
+
+    criados = 0
+    falhas = []
+    cpfs_vistos: set[str] = set()
+    async with context.session_factory() as db_session:
+        uow = UnitOfWork(db_session)
+        for inicio in range(0, total, BULK_BATCH_SIZE):
+            lote = list(enumerate(params.atletas[inicio:inicio + BULK_BATCH_SIZE], start=inicio + 1))
+            for resultado in await inserir_lote(uow, lote, cpfs_vistos):
+                if resultado.status == 'criado':
+                    criados += 1
+                else:
+                    falhas.append(resultado.model_dump(mode='json', exclude_none=True))
+            await context.progresso(min(inicio + BULK_BATCH_SIZE, total))
+
+    return {'criados': criados, 'erros': len(falhas), 'falhas': falhas}
+
+
+@register_job('atletas_export', AtletasExportParams)
+async def exportar_atletas(context: JobContext, params: AtletasExportParams) -> dict[str, Any]:
+    """Grava o export de atletas em JOBS_OUTPUT_DIR; o arquivo sai em GET /jobs/{id}/arquivo."""
+    async with context.session_factory() as db_session:
+        total = (await db_session.execute(select(func.count()).select_from(AtletaModel))).scalar()
+    await context.progresso(0, total)
+
+    os.makedirs(settings.JOBS_OUTPUT_DIR, exist_ok=True)
+    arquivo = f'atletas-{context.job_id}.{params.format}'
+    caminho = os.path.join(settings.JOBS_OUTPUT_DIR, arquivo)
+
+    # Escreve em um arquivo temporário para nunca servir um export pela metade
+    linhas = -1 if params.format == 'csv' else 0
+    with open(caminho + '.parcial', 'w', encoding='utf-8', newline='') as saida:
+        async for chunk in export_chunks(params.format, context.session_factory):
+            await asyncio.to_thread(saida.write, chunk)
+            linhas += chunk.count('\n')
+            await context.progresso(max(linhas, 0))
+    os.replace(caminho + '.parcial', caminho)
+
+    # Atletas criados durante o export também saem no arquivo; o total final é o exportado
+    linhas = max(linhas, 0)
+    await context.progresso(linhas, linhas)
+    return {'arquivo': arquivo, 'linhas': linhas}
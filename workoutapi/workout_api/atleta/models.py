@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from workout_api.contrib.models import BaseModel
-from sqlalchemy import DateTime, Float, ForeignKey, String, Column, Integer
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Column, Integer
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -15,8 +15,18 @@ if TYPE_CHECKING:
 
 class AtletaModel(BaseModel):
     __tablename__ = "atletas"
+    __table_args__ = (
+        # Ordem da paginação por cursor
+        Index("ix_atletas_created_at_id", "created_at", "id"),
+        # Busca parcial por nome (ILIKE '%...%') ordenada por similaridade; o GiST atende
+        # o filtro e o ORDER BY por distância (KNN). Requer a extensão pg_trgm
+        Index(
+            "ix_atletas_nome_trgm", "nome",
+            postgresql_using="gist", postgresql_ops={"nome": "gist_trgm_ops"},
+        ),
+    )
     
-    nome = Column(String(100), nullable=False)
+    nome = Column(String(100), nullable=False, index=True)
     cpf = Column(String(11), unique=True, nullable=False)
     idade = Column(Integer, nullable=False)
     peso = Column(Float, nullable=False)
@@ -24,8 +34,8 @@ class AtletaModel(BaseModel):
     sexo = Column(String(1), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
-    categoria_id = Column(UUID(as_uuid=True), ForeignKey("categorias.id"), nullable=False)
-    centro_treinamento_id = Column(UUID(as_uuid=True), ForeignKey("centro_treinamento.id"), nullable=False)
+    categoria_id = Column(UUID(as_uuid=True), ForeignKey("categorias.id"), nullable=False, index=True)
+    centro_treinamento_id = Column(UUID(as_uuid=True), ForeignKey("centro_treinamento.id"), nullable=False, index=True)
     
     # Relationships
     categoria = relationship("CategoriaModel", back_populates="atletas")
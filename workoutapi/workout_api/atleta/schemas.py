@@ -1,7 +1,8 @@
-from typing import Annotated, Optional
+from typing import Annotated, Any, Literal, Optional
 from datetime import datetime
 from pydantic import Field, PositiveFloat, UUID4
-from workout_api.contrib.schemas import BaseSchema, OutMixin
+from workout_api.contrib.batch import BATCH_MAX_IDS
+from workout_api.contrib.schemas import BaseSchema, OutMixin, PartialSchema
 from workout_api.categorias.schemas import CategoriaOut
 from workout_api.centro_treinamento.schemas import CentroTreinamentoOut
 
@@ -22,9 +23,58 @@ class AtletaOut(Atleta, OutMixin):
     categoria: Annotated[CategoriaOut, Field(description="Categoria do atleta")]
     centro_treinamento: Annotated[CentroTreinamentoOut, Field(description="Centro de treinamento do atleta")]
 
-class AtletaUpdate(BaseSchema):
+class AtletaUpdate(PartialSchema):
     nome: Annotated[Optional[str], Field(None, description="Nome do atleta", example="João da Silva", min_length=3, max_length=100)]
     idade: Annotated[Optional[int], Field(None, description="Idade do atleta", example=25, min_value=18, max_value=100)]
     peso: Annotated[Optional[PositiveFloat], Field(None, description="Peso do atleta", example=70.5, min_value=30, max_value=200)]
     altura: Annotated[Optional[PositiveFloat], Field(None, description="Altura do atleta", example=1.75, min_value=1.5, max_value=2.5)]
-    
\ No newline at end of file
+
+class AtletaBulkResultado(BaseSchema):
+    linha: Annotated[int, Field(description="Posição do atleta no lote (a partir de 1)", example=1)]
+    status: Annotated[Literal["criado", "erro"], Field(description="Resultado da inserção")]
+    id: Annotated[Optional[UUID4], Field(None, description="ID do atleta criado")]
+    detail: Annotated[Optional[str], Field(None, description="Motivo do erro")]
+
+class AtletaBulkOut(BaseSchema):
+    criados: Annotated[int, Field(description="Quantidade de atletas criados")]
+    erros: Annotated[int, Field(description="Quantidade de linhas rejeitadas")]
+    resultados: Annotated[list[AtletaBulkResultado], Field(description="Resultado de cada linha, na ordem enviada")]
+
+class AtletasCompactoOut(BaseSchema):
+    items: Annotated[list[dict[str, Any]], Field(description="Atletas com categoria_id e centro_treinamento_id no lugar dos objetos")]
+    categorias: Annotated[dict[UUID4, CategoriaOut], Field(description="Categorias referenciadas na página, por id")]
+    centros_treinamento: Annotated[dict[UUID4, CentroTreinamentoOut], Field(description="Centros de treinamento referenciados na página, por id")]
+    next_cursor: Annotated[Optional[str], Field(None, description="Cursor para a próxima página (null na última)")]
+
+class AtletaSearchOut(BaseSchema):
+    items: Annotated[list[AtletaOut], Field(description="Atletas encontrados, do mais ao menos relevante")]
+    next_offset: Annotated[Optional[int], Field(None, description="offset da próxima página (null na última)")]
+
+class AtletasImportParams(BaseSchema):
+    atletas: Annotated[list[dict[str, Any]], Field(description="Atletas a criar; cada um é validado como no POST /atleta/bulk", min_length=1)]
+
+class AtletasExportParams(BaseSchema):
+    format: Annotated[Literal["ndjson", "csv"], Field("ndjson", description="Formato do arquivo exportado")]
+
+class AtletaBulkFiltro(BaseSchema):
+    ids: Annotated[Optional[list[UUID4]], Field(None, description="IDs dos atletas", min_length=1, max_length=BATCH_MAX_IDS)]
+    categoria_id: Annotated[Optional[UUID4], Field(None, description="Só atletas desta categoria")]
+    centro_treinamento_id: Annotated[Optional[UUID4], Field(None, description="Só atletas deste centro de treinamento")]
+
+class AtletaBulkValores(PartialSchema):
+    idade: Annotated[Optional[int], Field(None, description="Idade do atleta", example=25, min_value=18, max_value=100)]
+    peso: Annotated[Optional[PositiveFloat], Field(None, description="Peso do atleta", example=70.5, min_value=30, max_value=200)]
+    altura: Annotated[Optional[PositiveFloat], Field(None, description="Altura do atleta", example=1.75, min_value=1.5, max_value=2.5)]
+    categoria: Annotated[Optional[str], Field(None, description="Nome da nova categoria")]
+    centro_treinamento: Annotated[Optional[str], Field(None, description="Nome do novo centro de treinamento")]
+
+class AtletaBulkUpdateIn(BaseSchema):
+    filtro: Annotated[AtletaBulkFiltro, Field(description="Atletas afetados (os critérios são combinados com AND)")]
+    valores: Annotated[AtletaBulkValores, Field(description="Campos a alterar em todos os atletas do filtro")]
+
+class AtletaBulkDeleteIn(BaseSchema):
+    filtro: Annotated[AtletaBulkFiltro, Field(description="Atletas afetados (os critérios são combinados com AND)")]
+
+class AtletaBulkAfetadosOut(BaseSchema):
+    afetados: Annotated[int, Field(description="Quantidade de atletas alterados ou removidos")]
+    ids: Annotated[list[UUID4], Field(description="IDs dos atletas alterados ou removidos")]
@@ -0,0 +1,152 @@
+"""Operações de atletas compartilhadas pelas rotas HTTP e pelos jobs em segundo plano."""
+import csv
+import io
+from typing import Any, AsyncIterator, Callable
+
+from pydantic import ValidationError
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaBulkResultado, AtletaIn, AtletaOut
+from workout_api.configs.database import read_session
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
+
+EXPORT_BATCH_SIZE = 1000
+BULK_BATCH_SIZE = 1000
+EXPORT_CSV_COLUMNS = [
+    'id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo',
+    'categoria', 'centro_treinamento', 'created_at', 'updated_at',
+]
+
+
+def atleta_out(atleta: Any, categoria: Any = None, centro_treinamento: Any = None) -> AtletaOut:
+    # `atleta` é um AtletaModel com as relações carregadas ou uma linha de RETURNING,
+    # com a categoria e o centro de treinamento já resolvidos
+    return AtletaOut(
+        id=atleta.id,
+        nome=atleta.nome,
+        cpf=atleta.cpf,
+        idade=atleta.idade,
+        peso=atleta.peso,
+        altura=atleta.altura,
+        sexo=atleta.sexo,
+        created_at=atleta.created_at,
+        updated_at=atleta.updated_at,
+        categoria=categoria or atleta.categoria,
+        centro_treinamento=centro_treinamento or atleta.centro_treinamento
+    )
+
+
+async def inserir_lote(
+    uow: UnitOfWork, lote: list[tuple[int, Any]], cpfs_vistos: set[str]
+) -> list[AtletaBulkResultado]:
+    """Valida e insere um lote de atletas (dicts ou linhas NDJSON) com um INSERT multi-linha.
+
+    Usado pelo POST /atleta/bulk e pelo job atletas_import. `cpfs_vistos` acumula os CPFs
+    dos lotes anteriores da mesma importação, para rejeitar repetições entre lotes; os do
+    lote só entram nele depois do commit, para um lote que falhou não bloquear os seguintes.
+    """
+    resultados: dict[int, AtletaBulkResultado] = {}
+    validos: list[tuple[int, AtletaIn]] = []
+
+    for linha, item in lote:
+        try:
+            if isinstance(item, bytes):
+                atleta_in = AtletaIn.model_validate_json(item)
+            else:
+                atleta_in = AtletaIn.model_validate(item)
+        except ValidationError as e:
+            detail = '; '.join(
+                f"{'.'.join(str(loc) for loc in erro['loc']) or 'corpo'}: {erro['msg']}" for erro in e.errors()
+            )
+            resultados[linha] = AtletaBulkResultado(linha=linha, status='erro', detail=detail)
+            continue
+        validos.append((linha, atleta_in))
+
+    # No máximo uma consulta por tabela para resolver os nomes do lote inteiro
+    categorias = await uow.categorias.by_nomes({atleta_in.categoria for _, atleta_in in validos})
+    centros = await uow.centros_treinamento.by_nomes({atleta_in.centro_treinamento for _, atleta_in in validos})
+
+    linhas_por_cpf: dict[str, int] = {}
+    valores = []
+    for linha, atleta_in in validos:
+        categoria = categorias.get(atleta_in.categoria)
+        centro_treinamento = centros.get(atleta_in.centro_treinamento)
+        if not categoria:
+            detail = f'A categoria {atleta_in.categoria} não foi encontrada.'
+        elif not centro_treinamento:
+            detail = f'O centro de treinamento {atleta_in.centro_treinamento} não foi encontrado.'
+        elif atleta_in.cpf in cpfs_vistos or atleta_in.cpf in linhas_por_cpf:
+            detail = f'CPF repetido na requisição: {atleta_in.cpf}'
+        else:
+            detail = None
+
+        if detail:
+            resultados[linha] = AtletaBulkResultado(linha=linha, status='erro', detail=detail)
+            continue
+
+        linhas_por_cpf[atleta_in.cpf] = linha
+        valores.append({
+            **atleta_in.model_dump(exclude={'categoria', 'centro_treinamento'}),
+            'categoria_id': categoria.id,
+            'centro_treinamento_id': centro_treinamento.id,
+        })
+
+    if valores:
+        # INSERT multi-linha; CPFs já cadastrados são ignorados pelo ON CONFLICT
+        # e ficam de fora do RETURNING. Cada lote tem o próprio commit: um import
+        # grande não fica em uma transação só e um lote com erro não desfaz os anteriores
+        try:
+            inseridos = dict(
+                (cpf, id) for id, cpf in await uow.atletas.insert_many(
+                    valores, conflict=AtletaModel.cpf, returning=[AtletaModel.id, AtletaModel.cpf]
+                )
+            )
+            await uow.commit()
+            cpfs_vistos.update(linhas_por_cpf)
+        except Exception:
+            await uow.rollback()
+            inseridos = None
+
+        for cpf, linha in linhas_por_cpf.items():
+            if inseridos is None:
+                resultados[linha] = AtletaBulkResultado(
+                    linha=linha, status='erro', detail='Ocorreu um erro ao inserir os dados no banco'
+                )
+            elif cpf in inseridos:
+                resultados[linha] = AtletaBulkResultado(linha=linha, status='criado', id=inseridos[cpf])
+            else:
+                resultados[linha] = AtletaBulkResultado(
+                    linha=linha, status='erro', detail=f'Já existe um atleta cadastrado com o CPF: {cpf}'
+                )
+
+    return [resultados[linha] for linha, _ in lote]
+
+
+async def export_chunks(format: str, abrir_sessao: Callable[[], Any] = read_session) -> AsyncIterator[str]:
+    """Todos os atletas em NDJSON ou CSV, um bloco por lote de EXPORT_BATCH_SIZE.
+
+    Usado pelo GET /atleta/export e pelo job atletas_export. A sessão é aberta aqui e não
+    via dependência: a dependência é encerrada antes do corpo de um StreamingResponse
+    começar a ser enviado. Os jobs passam a fábrica de sessões do próprio pool.
+    """
+    if format == 'csv':
+        yield ','.join(EXPORT_CSV_COLUMNS) + '\r\n'
+
+    async with abrir_sessao() as db_session:
+        async for partition in UnitOfWork(db_session).atletas.stream(EXPORT_BATCH_SIZE):
+            if format == 'csv':
+                yield atletas_csv(partition)
+            else:
+                yield ''.join(atleta_out(atleta).model_dump_json() + '\n' for atleta in partition)
+
+
+def atletas_csv(atletas: list[AtletaModel]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for atleta in atletas:
+        writer.writerow([
+            atleta.id, atleta.nome, atleta.cpf, atleta.idade, atleta.peso, atleta.altura, atleta.sexo,
+            atleta.categoria.nome, atleta.centro_treinamento.nome,
+            atleta.created_at.isoformat(), atleta.updated_at.isoformat(),
+        ])
+    return buffer.getvalue()
@@ -1,11 +1,14 @@
-import uuid
-from fastapi import APIRouter, HTTPException, status, Body
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Body
 from pydantic import UUID4
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
-from datetime import datetime
 from workout_api.categorias.models import CategoriaModel
-from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.batch import in_order
+from workout_api.contrib.dependencies import PaginationDependency, ReadUnitOfWorkDependency, UnitOfWorkDependency
+from workout_api.contrib.http_cache import conditional_response, make_etag
+from workout_api.contrib.responses import schema_response
+from workout_api.contrib.schemas import BatchGetIn, BatchGetOut, Page
 
 api_router = APIRouter()
 
@@ -15,139 +18,124 @@ api_router = APIRouter()
     status_code=status.HTTP_201_CREATED, 
     response_model=CategoriaOut
 )
-async def create_categoria(db_session: DatabaseDependency, categoria_in: CategoriaIn = Body(...)) -> CategoriaOut:
-    # Verificar se categoria já existe
-    categoria_exists = (await db_session.execute(
-        select(CategoriaModel).filter_by(nome=categoria_in.nome)
-    )).scalars().first()
-    
-    if categoria_exists:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f'Já existe uma categoria com o nome: {categoria_in.nome}'
-        )
-    
+async def create_categoria(uow: UnitOfWorkDependency, categoria_in: CategoriaIn = Body(...)) -> CategoriaOut:
+    # Um único round trip: o índice único de nome decide o conflito, sem SELECT prévio
     try:
-        categoria_id = uuid.uuid4()
-        categoria_model = CategoriaModel(
-            id=categoria_id,
-            nome=categoria_in.nome,
-            created_at=datetime.utcnow()
-        )
-
-        db_session.add(categoria_model)
-        await db_session.commit()
-        await db_session.refresh(categoria_model)
-        
-        return CategoriaOut(
-            id=categoria_model.id,
-            nome=categoria_model.nome,
-            created_at=categoria_model.created_at,
-            updated_at=categoria_model.updated_at
-        )
+        categoria_out = await uow.categorias.create(categoria_in.model_dump())
+        await uow.commit()
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao criar a categoria'
         )
 
+    if not categoria_out:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'Já existe uma categoria com o nome: {categoria_in.nome}'
+        )
+
+    return schema_response(categoria_out, status_code=status.HTTP_201_CREATED)
+
 @api_router.get("/", summary="Listar categorias",
                 status_code=status.HTTP_200_OK,
-                response_model=list[CategoriaOut])
-async def get_categorias(db_session: DatabaseDependency) -> list[CategoriaOut]:
-    categorias = (await db_session.execute(select(CategoriaModel))).scalars().all()
-    return [CategoriaOut(
-        id=categoria.id,
-        nome=categoria.nome,
-        created_at=categoria.created_at,
-        updated_at=categoria.updated_at
-    ) for categoria in categorias]
+                response_model=Page[CategoriaOut])
+async def get_categorias(
+    request: Request,
+    response: Response,
+    uow: ReadUnitOfWorkDependency,
+    page: PaginationDependency,
+    nome: Optional[str] = Query(None, description="Filtrar pelo nome"),
+) -> Page[CategoriaOut]:
+    stmt = uow.categorias.select()
+    if nome:
+        stmt = stmt.where(CategoriaModel.nome == nome)
+
+    categorias, next_cursor = await uow.categorias.page(stmt, page)
+
+    etag = make_etag([next_cursor, *(part for item in categorias for part in (item.id, item.updated_at))])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    return schema_response(Page[CategoriaOut](
+        items=[uow.categorias.to_schema(categoria) for categoria in categorias],
+        next_cursor=next_cursor
+    ), response)
+
+@api_router.post("/batch-get", summary="Buscar várias categorias por ID",
+                 status_code=status.HTTP_200_OK,
+                 response_model=BatchGetOut[CategoriaOut])
+async def batch_get_categorias(uow: ReadUnitOfWorkDependency, batch: BatchGetIn = Body(...)) -> BatchGetOut[CategoriaOut]:
+    # Ids em cache não vão ao banco; os demais saem de um único SELECT
+    items, missing = in_order(batch.ids, await uow.categorias.by_ids(batch.ids))
+    return schema_response(BatchGetOut[CategoriaOut](items=items, missing=missing))
 
 @api_router.get("/{categoria_id}", summary="Buscar categoria por ID",
                 status_code=status.HTTP_200_OK,
                 response_model=CategoriaOut)
-async def get_categoria_by_id(categoria_id: UUID4, db_session: DatabaseDependency) -> CategoriaOut:
-    categoria = (await db_session.execute(
-        select(CategoriaModel).where(CategoriaModel.id == categoria_id)
-    )).scalars().first()
+async def get_categoria_by_id(categoria_id: UUID4, request: Request, response: Response, uow: ReadUnitOfWorkDependency) -> CategoriaOut:
+    categoria_out = await uow.categorias.by_id(categoria_id)
     
-    if not categoria:
+    if not categoria_out:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="Categoria não encontrada"
         )
-    
-    return CategoriaOut(
-        id=categoria.id,
-        nome=categoria.nome,
-        created_at=categoria.created_at,
-        updated_at=categoria.updated_at
-    )
+
+    not_modified = conditional_response(request, response, make_etag((categoria_out.id, categoria_out.updated_at)))
+    if not_modified:
+        return not_modified
+    return schema_response(categoria_out, response)
 
 @api_router.patch("/{categoria_id}", summary="Atualizar categoria",
                  status_code=status.HTTP_200_OK,
                  response_model=CategoriaOut)
-async def update_categoria(categoria_id: UUID4, db_session: DatabaseDependency, categoria_in: CategoriaIn = Body(...)) -> CategoriaOut:
-    categoria = (await db_session.execute(
-        select(CategoriaModel).where(CategoriaModel.id == categoria_id)
-    )).scalars().first()
-    
-    if not categoria:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Categoria não encontrada"
-        )
-    
-    # Verificar se novo nome já existe em outra categoria
-    if categoria_in.nome != categoria.nome:
-        nome_exists = (await db_session.execute(
-            select(CategoriaModel).filter_by(nome=categoria_in.nome)
-        )).scalars().first()
-        
-        if nome_exists:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f'Já existe uma categoria com o nome: {categoria_in.nome}'
-            )
-    
+async def update_categoria(categoria_id: UUID4, uow: UnitOfWorkDependency, categoria_in: CategoriaIn = Body(...)) -> CategoriaOut:
+    # UPDATE ... RETURNING: sem SELECT antes nem refresh depois
     try:
-        categoria.nome = categoria_in.nome
-        await db_session.commit()
-        await db_session.refresh(categoria)
-        
-        return CategoriaOut(
-            id=categoria.id,
-            nome=categoria.nome,
-            created_at=categoria.created_at,
-            updated_at=categoria.updated_at
+        categoria = await uow.categorias.update(categoria_id, categoria_in.model_dump())
+        if categoria:
+            await uow.commit()
+    except IntegrityError:
+        # Nome já usado por outra categoria (índice único)
+        await uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'Já existe uma categoria com o nome: {categoria_in.nome}'
         )
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao atualizar a categoria'
         )
 
-@api_router.delete("/{categoria_id}", summary="Deletar categoria",
-                  status_code=status.HTTP_204_NO_CONTENT)
-async def delete_categoria(categoria_id: UUID4, db_session: DatabaseDependency) -> None:
-    categoria = (await db_session.execute(
-        select(CategoriaModel).where(CategoriaModel.id == categoria_id)
-    )).scalars().first()
-    
     if not categoria:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Categoria não encontrada"
         )
-    
+
+    return schema_response(uow.categorias.to_schema(categoria))
+
+@api_router.delete("/{categoria_id}", summary="Deletar categoria",
+                  status_code=status.HTTP_204_NO_CONTENT)
+async def delete_categoria(categoria_id: UUID4, uow: UnitOfWorkDependency) -> None:
     try:
-        await db_session.delete(categoria)
-        await db_session.commit()
+        categoria = await uow.categorias.delete(categoria_id)
+        if categoria:
+            await uow.commit()
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao deletar a categoria'
-        )
\ No newline at end of file
+        )
+
+    if not categoria:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Categoria não encontrada"
+        )
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 from workout_api.contrib.models import BaseModel
-from sqlalchemy import String, Column, DateTime
+from sqlalchemy import String, Column, DateTime, Index
 from sqlalchemy.orm import relationship, Mapped
 
 if TYPE_CHECKING:
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 class CategoriaModel(BaseModel):
     __tablename__ = "categorias"
+    __table_args__ = (
+        Index("ix_categorias_created_at_id", "created_at", "id"),
+    )
     
     nome = Column(String(100), unique=True, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,11 +1,14 @@
-import uuid
-from fastapi import APIRouter, HTTPException, status, Body
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Body
 from pydantic import UUID4
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from workout_api.centro_treinamento.schemas import CentroTreinamentoIn, CentroTreinamentoOut
-from datetime import datetime
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.batch import in_order
+from workout_api.contrib.dependencies import PaginationDependency, ReadUnitOfWorkDependency, UnitOfWorkDependency
+from workout_api.contrib.http_cache import conditional_response, make_etag
+from workout_api.contrib.responses import schema_response
+from workout_api.contrib.schemas import BatchGetIn, BatchGetOut, Page
 
 api_router = APIRouter()
 
@@ -15,152 +18,124 @@ api_router = APIRouter()
     status_code=status.HTTP_201_CREATED, 
     response_model=CentroTreinamentoOut
 )
-async def create_centro_treinamento(db_session: DatabaseDependency, centro_treinamento_in: CentroTreinamentoIn = Body(...)) -> CentroTreinamentoOut:
-    # Verificar se centro de treinamento já existe
-    centro_exists = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(nome=centro_treinamento_in.nome)
-    )).scalars().first()
-    
-    if centro_exists:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f'Já existe um centro de treinamento com o nome: {centro_treinamento_in.nome}'
-        )
-    
+async def create_centro_treinamento(uow: UnitOfWorkDependency, centro_treinamento_in: CentroTreinamentoIn = Body(...)) -> CentroTreinamentoOut:
+    # Um único round trip: o índice único de nome decide o conflito, sem SELECT prévio
     try:
-        centro_id = uuid.uuid4()
-        centro_treinamento_model = CentroTreinamentoModel(
-            id=centro_id,
-            nome=centro_treinamento_in.nome,
-            endereco=centro_treinamento_in.endereco,
-            proprietario=centro_treinamento_in.proprietario,
-            created_at=datetime.utcnow()
-        )
-
-        db_session.add(centro_treinamento_model)
-        await db_session.commit()
-        await db_session.refresh(centro_treinamento_model)
-        
-        return CentroTreinamentoOut(
-            id=centro_treinamento_model.id,
-            nome=centro_treinamento_model.nome,
-            endereco=centro_treinamento_model.endereco,
-            proprietario=centro_treinamento_model.proprietario,
-            created_at=centro_treinamento_model.created_at,
-            updated_at=centro_treinamento_model.updated_at
-        )
+        centro_treinamento_out = await uow.centros_treinamento.create(centro_treinamento_in.model_dump())
+        await uow.commit()
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao criar o centro de treinamento'
         )
 
+    if not centro_treinamento_out:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'Já existe um centro de treinamento com o nome: {centro_treinamento_in.nome}'
+        )
+
+    return schema_response(centro_treinamento_out, status_code=status.HTTP_201_CREATED)
+
 @api_router.get("/", summary="Listar centros de treinamento",
                 status_code=status.HTTP_200_OK,
-                response_model=list[CentroTreinamentoOut])
-async def get_centro_treinamento(db_session: DatabaseDependency) -> list[CentroTreinamentoOut]:
-    centros_treinamento = (await db_session.execute(select(CentroTreinamentoModel))).scalars().all()
-    return [CentroTreinamentoOut(
-        id=centro.id,
-        nome=centro.nome,
-        endereco=centro.endereco,
-        proprietario=centro.proprietario,
-        created_at=centro.created_at,
-        updated_at=centro.updated_at
-    ) for centro in centros_treinamento]
+                response_model=Page[CentroTreinamentoOut])
+async def get_centro_treinamento(
+    request: Request,
+    response: Response,
+    uow: ReadUnitOfWorkDependency,
+    page: PaginationDependency,
+    nome: Optional[str] = Query(None, description="Filtrar pelo nome"),
+) -> Page[CentroTreinamentoOut]:
+    stmt = uow.centros_treinamento.select()
+    if nome:
+        stmt = stmt.where(CentroTreinamentoModel.nome == nome)
+
+    centros_treinamento, next_cursor = await uow.centros_treinamento.page(stmt, page)
+
+    etag = make_etag([next_cursor, *(part for item in centros_treinamento for part in (item.id, item.updated_at))])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    return schema_response(Page[CentroTreinamentoOut](
+        items=[uow.centros_treinamento.to_schema(centro) for centro in centros_treinamento],
+        next_cursor=next_cursor
+    ), response)
+
+@api_router.post("/batch-get", summary="Buscar vários centros de treinamento por ID",
+                 status_code=status.HTTP_200_OK,
+                 response_model=BatchGetOut[CentroTreinamentoOut])
+async def batch_get_centros_treinamento(uow: ReadUnitOfWorkDependency, batch: BatchGetIn = Body(...)) -> BatchGetOut[CentroTreinamentoOut]:
+    # Ids em cache não vão ao banco; os demais saem de um único SELECT
+    items, missing = in_order(batch.ids, await uow.centros_treinamento.by_ids(batch.ids))
+    return schema_response(BatchGetOut[CentroTreinamentoOut](items=items, missing=missing))
 
 @api_router.get("/{centro_treinamento_id}", summary="Buscar centro de treinamento por ID",
                 status_code=status.HTTP_200_OK,
                 response_model=CentroTreinamentoOut)
-async def get_centro_treinamento_by_id(centro_treinamento_id: UUID4, db_session: DatabaseDependency) -> CentroTreinamentoOut:
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).where(CentroTreinamentoModel.id == centro_treinamento_id)
-    )).scalars().first()
+async def get_centro_treinamento_by_id(centro_treinamento_id: UUID4, request: Request, response: Response, uow: ReadUnitOfWorkDependency) -> CentroTreinamentoOut:
+    centro_treinamento_out = await uow.centros_treinamento.by_id(centro_treinamento_id)
     
-    if not centro_treinamento:
+    if not centro_treinamento_out:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="Centro de treinamento não encontrado"
         )
-    
-    return CentroTreinamentoOut(
-        id=centro_treinamento.id,
-        nome=centro_treinamento.nome,
-        endereco=centro_treinamento.endereco,
-        proprietario=centro_treinamento.proprietario,
-        created_at=centro_treinamento.created_at,
-        updated_at=centro_treinamento.updated_at
-    )
+
+    not_modified = conditional_response(request, response, make_etag((centro_treinamento_out.id, centro_treinamento_out.updated_at)))
+    if not_modified:
+        return not_modified
+    return schema_response(centro_treinamento_out, response)
 
 @api_router.patch("/{centro_treinamento_id}", summary="Atualizar centro de treinamento",
                  status_code=status.HTTP_200_OK,
                  response_model=CentroTreinamentoOut)
-async def update_centro_treinamento(centro_treinamento_id: UUID4, db_session: DatabaseDependency, centro_treinamento_in: CentroTreinamentoIn = Body(...)) -> CentroTreinamentoOut:
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).where(CentroTreinamentoModel.id == centro_treinamento_id)
-    )).scalars().first()
-    
-    if not centro_treinamento:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Centro de treinamento não encontrado"
-        )
-    
-    # Verificar se novo nome já existe em outro centro
-    if centro_treinamento_in.nome != centro_treinamento.nome:
-        nome_exists = (await db_session.execute(
-            select(CentroTreinamentoModel).filter_by(nome=centro_treinamento_in.nome)
-        )).scalars().first()
-        
-        if nome_exists:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f'Já existe um centro de treinamento com o nome: {centro_treinamento_in.nome}'
-            )
-    
+async def update_centro_treinamento(centro_treinamento_id: UUID4, uow: UnitOfWorkDependency, centro_treinamento_in: CentroTreinamentoIn = Body(...)) -> CentroTreinamentoOut:
+    # UPDATE ... RETURNING: sem SELECT antes nem refresh depois
     try:
-        centro_treinamento.nome = centro_treinamento_in.nome
-        centro_treinamento.endereco = centro_treinamento_in.endereco
-        centro_treinamento.proprietario = centro_treinamento_in.proprietario
-        
-        await db_session.commit()
-        await db_session.refresh(centro_treinamento)
-        
-        return CentroTreinamentoOut(
-            id=centro_treinamento.id,
-            nome=centro_treinamento.nome,
-            endereco=centro_treinamento.endereco,
-            proprietario=centro_treinamento.proprietario,
-            created_at=centro_treinamento.created_at,
-            updated_at=centro_treinamento.updated_at
+        centro_treinamento = await uow.centros_treinamento.update(centro_treinamento_id, centro_treinamento_in.model_dump())
+        if centro_treinamento:
+            await uow.commit()
+    except IntegrityError:
+        # Nome já usado por outro centro de treinamento (índice único)
+        await uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'Já existe um centro de treinamento com o nome: {centro_treinamento_in.nome}'
         )
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao atualizar o centro de treinamento'
         )
 
-@api_router.delete("/{centro_treinamento_id}", summary="Deletar centro de treinamento",
-                  status_code=status.HTTP_204_NO_CONTENT)
-async def delete_centro_treinamento(centro_treinamento_id: UUID4, db_session: DatabaseDependency) -> None:
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).where(CentroTreinamentoModel.id == centro_treinamento_id)
-    )).scalars().first()
-    
     if not centro_treinamento:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Centro de treinamento não encontrado"
         )
-    
+
+    return schema_response(uow.centros_treinamento.to_schema(centro_treinamento))
+
+@api_router.delete("/{centro_treinamento_id}", summary="Deletar centro de treinamento",
+                  status_code=status.HTTP_204_NO_CONTENT)
+async def delete_centro_treinamento(centro_treinamento_id: UUID4, uow: UnitOfWorkDependency) -> None:
     try:
-        await db_session.delete(centro_treinamento)
-        await db_session.commit()
+        centro_treinamento = await uow.centros_treinamento.delete(centro_treinamento_id)
+        if centro_treinamento:
+            await uow.commit()
     except Exception:
-        await db_session.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Ocorreu um erro ao deletar o centro de treinamento'
-        )
\ No newline at end of file
+        )
+
+    if not centro_treinamento:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Centro de treinamento não encontrado"
+        )
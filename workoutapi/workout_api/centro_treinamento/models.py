@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 from workout_api.contrib.models import BaseModel
-from sqlalchemy import String, Column, DateTime
+from sqlalchemy import String, Column, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 class CentroTreinamentoModel(BaseModel):
     __tablename__ = "centro_treinamento"
+    __table_args__ = (
+        Index("ix_centro_treinamento_created_at_id", "created_at", "id"),
+    )
     
     nome = Column(String(100), unique=True, nullable=False)
     endereco = Column(String(100), nullable=False)
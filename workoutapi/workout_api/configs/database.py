@@ -1,15 +1,212 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from workout_api.configs.settings import settings
 
+logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.DB_URL, echo=False)
+@dataclass
+class PoolWaitStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Pool padrão do engine assíncrono que mede o tempo de espera por uma conexão."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def create_engine(
+    url: str,
+    *,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    statement_timeout_ms: Optional[int] = None,
+) -> AsyncEngine:
+    """Cria o engine com os ajustes de pool das settings; os argumentos sobrescrevem as settings."""
+    if statement_timeout_ms is None:
+        statement_timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+
+    connect_args: dict[str, Any] = {}
+    if make_url(url).get_driver_name() == 'asyncpg':
+        connect_args['statement_cache_size'] = settings.DB_STATEMENT_CACHE_SIZE
+        connect_args['prepared_statement_cache_size'] = settings.DB_STATEMENT_CACHE_SIZE
+        if statement_timeout_ms:
+            connect_args['server_settings'] = {'statement_timeout': str(statement_timeout_ms)}
+
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE if pool_size is None else pool_size,
+        max_overflow=settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.pool
+    status = {
+        'size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': max(pool.overflow(), 0),
+        'max_overflow': getattr(pool, '_max_overflow', settings.DB_MAX_OVERFLOW),
+    }
+    wait_stats = getattr(pool, 'wait_stats', None)
+    if wait_stats:
+        status.update(
+            checkouts=wait_stats.checkouts,
+            timeouts=wait_stats.timeouts,
+            wait_avg_ms=round(wait_stats.wait_total / wait_stats.checkouts * 1000, 3) if wait_stats.checkouts else 0.0,
+            wait_max_ms=round(wait_stats.wait_max * 1000, 3),
+        )
+    return status
+
+
+class ReadReplicaRouter:
+    """Distribui as leituras entre as réplicas em rodízio, pulando as que falharam recentemente."""
+
+    def __init__(self, urls: list[str], retry_seconds: float):
+        self.engines = [create_engine(url) for url in urls]
+        self.session_factories = [
+            sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+            for read_engine in self.engines
+        ]
+        self.retry_seconds = retry_seconds
+        self._unhealthy_until = [0.0] * len(self.engines)
+        self._counter = count()
+
+    def candidates(self) -> Iterator[tuple[int, sessionmaker]]:
+        if not self.engines:
+            return
+        start = next(self._counter)
+        now = time.monotonic()
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._unhealthy_until[index] <= now:
+                yield index, self.session_factories[index]
+
+    def mark_unhealthy(self, index: int) -> None:
+        self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+
+    def is_healthy(self, index: int) -> bool:
+        return self._unhealthy_until[index] <= time.monotonic()
+
+
+# Processo que criou os engines; outro pid no startup indica um fork depois do import
+_engines_pid = os.getpid()
+
+engine = create_engine(settings.DB_URL)
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
+read_router = ReadReplicaRouter(
+    [url.strip() for url in settings.DB_READ_URLS.split(',') if url.strip()],
+    settings.DB_READ_RETRY_SECONDS,
+)
+
+def all_engines() -> list[AsyncEngine]:
+    return [engine, *read_router.engines]
+
+
+async def warmup_engine(target: AsyncEngine, connections: int) -> None:
+    """Abre `connections` conexões ao mesmo tempo e as devolve ao pool."""
+    if connections <= 0:
+        return
+    try:
+        abertas = await asyncio.gather(*(target.connect() for _ in range(connections)))
+    except (exc.SQLAlchemyError, OSError) as error:
+        # O startup segue; o readiness reporta o banco fora do ar
+        logger.warning('Aquecimento do pool de %s falhou: %s', target.url.render_as_string(), str(error).partition('\n')[0])
+        return
+    await asyncio.gather(*(connection.close() for connection in abertas))
+
+
+async def start_engines() -> None:
+    """Prepara os engines no processo do worker (startup do lifespan).
+
+    Os engines são criados no import, sem abrir conexões. Só quando o app foi importado antes
+    do fork (gunicorn --preload) o pool herdado é trocado por um novo, sem fechar as conexões,
+    que pertencem ao processo pai; no processo que importou o app o pool é mantido. Depois abre
+    DB_POOL_WARMUP conexões por engine para a primeira requisição não pagar o connect.
+    """
+    if os.getpid() != _engines_pid:
+        for target in all_engines():
+            await target.dispose(close=False)
+    await asyncio.gather(*(warmup_engine(target, settings.DB_POOL_WARMUP) for target in all_engines()))
+
+
+async def stop_engines() -> None:
+    """Fecha as conexões do pool no shutdown, depois que as requisições em andamento terminaram."""
+    for target in all_engines():
+        await target.dispose()
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Sessão somente leitura: usa uma réplica saudável ou, na falta dela, o primário.
+
+    A conexão é obtida já na abertura para detectar réplicas fora do ar antes da
+    consulta. Réplicas podem estar atrasadas em relação ao primário; as sessões delas
+    saem marcadas com `session.info['replica']`.
+    """
+    for index, session_factory in read_router.candidates():
+        session = session_factory()
+        try:
+            await session.connection()
+        except (exc.SQLAlchemyError, OSError):
+            await session.close()
+            read_router.mark_unhealthy(index)
+            continue
+        session.info['replica'] = True
+        async with session:
+            yield session
+        return
+
+    async with async_session() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with read_session() as session:
         yield session
\ No newline at end of file
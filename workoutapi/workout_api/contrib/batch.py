@@ -0,0 +1,34 @@
+from typing import Any, Hashable, Optional, Sequence
+
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+# Máximo de ids por chamada dos endpoints batch-get
+BATCH_MAX_IDS = 500
+
+
+def id_in(db_session: AsyncSession, column: Any, ids: Sequence[Hashable]) -> ColumnElement[bool]:
+    """Filtro `column = ANY(:ids)` no Postgres e `column IN (...)` nos demais bancos.
+
+    Com ANY os ids vão em um único parâmetro array, então o statement preparado (e o plano
+    em cache do asyncpg) é o mesmo para qualquer quantidade de ids; com IN cada quantidade
+    gera um SQL diferente.
+    """
+    if db_session.get_bind().dialect.name == 'postgresql':
+        return column == any_(bindparam('ids', list(ids), type_=ARRAY(column.type), unique=True))
+    return column.in_(ids)
+
+
+async def fetch_by_ids(db_session: AsyncSession, stmt: Select, column: Any, ids: Sequence[Hashable]) -> dict[Any, Any]:
+    """Executa `stmt` filtrado pelos ids em um único SELECT e indexa o resultado por id."""
+    registros = (await db_session.execute(stmt.where(id_in(db_session, column, ids)))).scalars().unique()
+    return {registro.id: registro for registro in registros}
+
+
+def in_order(ids: Sequence[Hashable], encontrados: dict[Any, Any]) -> tuple[list[Optional[Any]], list[Any]]:
+    """Itens na ordem de `ids` (None para os que não existem) e os ids não encontrados, sem repetir."""
+    items = [encontrados.get(id) for id in ids]
+    missing = list(dict.fromkeys(id for id in ids if id not in encontrados))
+    return items, missing
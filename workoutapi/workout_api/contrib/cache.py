@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from workout_api.configs.settings import settings
+
+
+class TTLCache:
+    """Cache LRU limitado a `maxsize` entradas, cada uma válida por `ttl` segundos."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Como `get`, mas sem contar hit/miss nem alterar a ordem LRU."""
+        entry = self._data.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ReferenceCache:
+    """Cache de entidades de referência (categoria, centro) indexado por id e por nome.
+
+    Os valores precisam expor `id` e `nome`. O cache é por processo: com vários
+    workers, a invalidação vale só para o processo que fez a escrita e os demais
+    enxergam a mudança quando a entrada expira (TTL).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._por_id = TTLCache(maxsize, ttl)
+        self._por_nome = TTLCache(maxsize, ttl)
+
+    def get_by_id(self, id: Hashable) -> Optional[Any]:
+        return self._por_id.get(id)
+
+    def get_by_nome(self, nome: str) -> Optional[Any]:
+        return self._por_nome.get(nome)
+
+    def set(self, value: Any) -> None:
+        self._por_id.set(value.id, value)
+        self._por_nome.set(value.nome, value)
+
+    def invalidate(self, id: Optional[Hashable] = None, nome: Optional[str] = None) -> None:
+        cached = self._por_id.peek(id) if id is not None else None
+        if cached is not None:
+            self._por_nome.pop(cached.nome)
+        if id is not None:
+            self._por_id.pop(id)
+        if nome is not None:
+            self._por_nome.pop(nome)
+
+    def clear(self) -> None:
+        self._por_id.clear()
+        self._por_nome.clear()
+
+    def stats(self) -> dict[str, int]:
+        hits = self._por_id.hits + self._por_nome.hits
+        misses = self._por_id.misses + self._por_nome.misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': len(self._por_id),
+            'maxsize': self._por_id.maxsize,
+        }
+
+
+categoria_cache = ReferenceCache(settings.CACHE_MAX_SIZE, settings.CACHE_TTL_SECONDS)
+centro_treinamento_cache = ReferenceCache(settings.CACHE_MAX_SIZE, settings.CACHE_TTL_SECONDS)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    return {
+        'categoria': categoria_cache.stats(),
+        'centro_treinamento': centro_treinamento_cache.stats(),
+    }
\ No newline at end of file
@@ -0,0 +1,218 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# brotli e zstandard são opcionais: sem o pacote, a codificação só não é oferecida
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Blocos a partir deste tamanho são comprimidos fora do event loop
+THREADPOOL_MIN_SIZE = 256 * 1024
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/x-ndjson', 'application/problem+json')
+# Streams que precisam chegar ao cliente evento a evento
+NOT_COMPRESSIBLE_TYPES = ('text/event-stream',)
+
+
+class Encoder(ABC):
+    """Compressor incremental: `compress` para cada bloco e `finish` no último.
+
+    `compress` já devolve os dados com flush, para que um StreamingResponse continue
+    chegando ao cliente bloco a bloco.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        ...
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> dict[str, type[Encoder]]:
+    encoders: dict[str, type[Encoder]] = {'gzip': GzipEncoder}
+    if brotli is not None:
+        encoders['br'] = BrotliEncoder
+    if zstandard is not None:
+        encoders['zstd'] = ZstdEncoder
+    return encoders
+
+
+def negotiate(accept_encoding: str, preferred: tuple[str, ...]) -> Optional[str]:
+    """Escolhe a codificação aceita pelo cliente (q > 0) com maior q; no empate vale a ordem de `preferred`."""
+    aceitas: dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        nome, _, parametros = item.strip().partition(';')
+        q = 1.0
+        parametro = parametros.strip()
+        if parametro.startswith('q='):
+            try:
+                q = float(parametro[2:])
+            except ValueError:
+                q = 0.0
+        aceitas[nome.strip().lower()] = q
+
+    candidatas = [
+        (aceitas.get(nome, aceitas.get('*', 0.0)), -posicao, nome)
+        for posicao, nome in enumerate(preferred)
+    ]
+    q, _, nome = max(candidatas, default=(0.0, 0, None))
+    return nome if q > 0 else None
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get('content-type', '')
+    return (
+        'content-encoding' not in headers
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+        and not content_type.startswith(NOT_COMPRESSIBLE_TYPES)
+    )
+
+
+class CompressionMiddleware:
+    """Middleware ASGI que comprime as respostas com gzip, br ou zstd conforme o Accept-Encoding.
+
+    Respostas de corpo único menores que `minimum_size` seguem sem compressão. Respostas em
+    streaming são comprimidas bloco a bloco (sem Content-Length). O ETag vira fraco na
+    resposta comprimida, pois os bytes não são mais os da representação original.
+    """
+
+    def __init__(self, app: ASGIApp, encodings: tuple[str, ...], levels: dict[str, int], minimum_size: int):
+        self.app = app
+        self.encoders = available_encoders()
+        self.encodings = tuple(nome for nome in encodings if nome in self.encoders)
+        self.levels = levels
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get('accept-encoding', ''), self.encodings)
+        responder = _CompressionResponder(
+            send, encoding, lambda: self.encoders[encoding](self.levels[encoding]), self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self, send: Send, encoding: Optional[str], encoder_factory: Callable[[], Encoder], minimum_size: int
+    ):
+        self._send = send
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[Encoder] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            headers = Headers(raw=message['headers'])
+            # 206: os bytes de um Range se referem ao corpo sem compressão
+            self.passthrough = message['status'] in (204, 206, 304) or not _compressible(headers)
+            if not self.passthrough or message['status'] == 304:
+                # Mesmo sem comprimir: caches precisam separar as versões por Accept-Encoding; o
+                # 304 (sem Content-Type) repete o Vary da resposta completa que ele revalida
+                MutableHeaders(scope=message).add_vary_header('Accept-Encoding')
+            if self.passthrough or self.encoding is None:
+                self.passthrough = True
+                await self._send(message)
+                return
+            # Segura o início até ver o primeiro bloco do corpo (tamanho e se há streaming)
+            self.start_message = message
+            return
+
+        if message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self.encoder = self.encoder_factory()
+            headers = MutableHeaders(scope=start)
+            headers['Content-Encoding'] = self.encoding
+            etag = headers.get('etag')
+            if etag and not etag.startswith('W/'):
+                headers['ETag'] = f'W/{etag}'
+            if more_body:
+                del headers['Content-Length']
+            else:
+                body = await self._encode(body, final=True)
+                headers['Content-Length'] = str(len(body))
+                await self._send(start)
+                await self._send({'type': 'http.response.body', 'body': body})
+                return
+            await self._send(start)
+
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        more_body = message.get('more_body', False)
+        body = await self._encode(message.get('body', b''), final=not more_body)
+        await self._send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+
+    async def _encode(self, data: bytes, final: bool) -> bytes:
+        def run() -> bytes:
+            comprimido = self.encoder.compress(data) if data else b''
+            return comprimido + self.encoder.finish() if final else comprimido
+
+        if len(data) >= THREADPOOL_MIN_SIZE:
+            return await run_in_threadpool(run)
+        return run()
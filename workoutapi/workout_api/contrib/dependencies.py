@@ -1,8 +1,51 @@
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, AsyncGenerator, Optional
+from fastapi import Depends, Query, Request
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from workout_api.configs.database import get_session
+from workout_api.configs.database import async_session, read_session
+from workout_api.contrib.pagination import DEFAULT_LIMIT, MAX_LIMIT, PageParams
+from workout_api.contrib.rate_limit import client_key, create_database_limiter
+from workout_api.contrib.repository.unit_of_work import UnitOfWork
 
-DatabaseDependency = Annotated[AsyncSession, Depends(get_session)]
\ No newline at end of file
+# Vagas para requisições que usam o banco (503/429 imediato quando não há vaga)
+db_limiter = create_database_limiter()
+
+
+async def get_limited_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with db_limiter.slot(client_key(request.scope)):
+        async with async_session() as session:
+            yield session
+
+
+async def get_limited_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with db_limiter.slot(client_key(request.scope)):
+        async with read_session() as session:
+            yield session
+
+
+DatabaseDependency = Annotated[AsyncSession, Depends(get_limited_session)]
+ReadDatabaseDependency = Annotated[AsyncSession, Depends(get_limited_read_session)]
+
+
+def get_unit_of_work(session: DatabaseDependency) -> UnitOfWork:
+    return UnitOfWork(session)
+
+
+def get_read_unit_of_work(session: ReadDatabaseDependency) -> UnitOfWork:
+    return UnitOfWork(session)
+
+
+# Repositórios sobre a sessão da requisição; o controller chama `commit` uma única vez
+UnitOfWorkDependency = Annotated[UnitOfWork, Depends(get_unit_of_work)]
+ReadUnitOfWorkDependency = Annotated[UnitOfWork, Depends(get_read_unit_of_work)]
+
+
+def get_page_params(
+    limit: Annotated[int, Query(ge=1, le=MAX_LIMIT, description="Quantidade máxima de registros")] = DEFAULT_LIMIT,
+    cursor: Annotated[Optional[str], Query(description="Cursor retornado em next_cursor")] = None,
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+PaginationDependency = Annotated[PageParams, Depends(get_page_params)]
\ No newline at end of file
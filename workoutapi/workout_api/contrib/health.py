@@ -0,0 +1,78 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from workout_api.configs.database import pool_status
+from workout_api.configs.settings import settings
+
+
+@dataclass
+class ReadinessResult:
+    ready: bool
+    body: dict[str, Any]
+    checked_at: float
+
+
+class ReadinessCheck:
+    """Verifica o banco com um SELECT 1 pelo pool e guarda o resultado por alguns segundos.
+
+    Probes concorrentes dentro do intervalo reaproveitam a mesma verificação, então o
+    orquestrador não gera carga extra no banco.
+    """
+
+    def __init__(self, engine: AsyncEngine, ttl: float, timeout: float):
+        self.engine = engine
+        self.ttl = ttl
+        self.timeout = timeout
+        self._result: Optional[ReadinessResult] = None
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self._result is not None and time.monotonic() - self._result.checked_at < self.ttl
+
+    async def _select_one(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text('SELECT 1'))
+
+    async def check(self) -> tuple[ReadinessResult, bool]:
+        """Retorna o resultado e se ele veio do cache."""
+        if self._fresh():
+            return self._result, True
+
+        async with self._lock:
+            if self._fresh():
+                return self._result, True
+
+            start = time.perf_counter()
+            database: dict[str, Any] = {}
+            try:
+                await asyncio.wait_for(self._select_one(), timeout=self.timeout)
+                ready = True
+            except asyncio.TimeoutError:
+                ready = False
+                database['error'] = f'SELECT 1 não respondeu em {self.timeout}s'
+            except Exception as exc:
+                ready = False
+                # Só a primeira linha; o resto da mensagem do SQLAlchemy é o link de ajuda
+                mensagem = str(exc).partition('\n')[0]
+                database['error'] = f'{type(exc).__name__}: {mensagem}'
+            database['latency_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+            pool = pool_status(self.engine)
+            capacidade = pool['size'] + pool['max_overflow']
+            pool['saturation'] = round(pool['checked_out'] / capacidade, 3) if capacidade else 0.0
+
+            body = {
+                'status': 'ready' if ready else 'unavailable',
+                'database': database,
+                'pool': pool,
+            }
+            self._result = ReadinessResult(ready=ready, body=body, checked_at=time.monotonic())
+            return self._result, False
+
+
+def create_readiness_check(engine: AsyncEngine) -> ReadinessCheck:
+    return ReadinessCheck(engine, ttl=settings.HEALTH_CACHE_SECONDS, timeout=settings.HEALTH_DB_TIMEOUT_SECONDS)
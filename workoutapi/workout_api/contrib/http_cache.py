@@ -0,0 +1,43 @@
+import hashlib
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from workout_api.configs.settings import settings
+
+# Headers da resposta completa que também vão no 304
+_NOT_MODIFIED_HEADERS = ('cache-control', 'content-location', 'date', 'etag', 'expires', 'vary')
+
+
+def make_etag(parts: Iterable[Any]) -> str:
+    """ETag forte a partir de valores que mudam junto com a representação (id, updated_at...)."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b'|')
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Aplica ETag/Cache-Control à resposta e devolve um 304 se o cliente já tem essa versão.
+
+    O 304 repete os headers da resposta completa que os caches usam para atualizar a cópia
+    guardada (Vary, Cache-Control etc.), como pede a RFC 9110 (seção 15.4.5).
+    """
+    response.headers.update({'ETag': etag, 'Cache-Control': settings.HTTP_CACHE_CONTROL})
+    if _etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={name: response.headers[name] for name in _NOT_MODIFIED_HEADERS if name in response.headers},
+        )
+    return None
\ No newline at end of file
@@ -0,0 +1,265 @@
+import bisect
+import hmac
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from workout_api.configs.settings import settings
+
+logger = logging.getLogger('workout_api.sql')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+@dataclass
+class RequestSQLStats:
+    statements: int = 0
+    duration: float = 0.0
+    last_end: Optional[float] = None
+    scope: Optional[Scope] = field(default=None, repr=False)
+    # (statement, parâmetros, duração) de cada SQL; só preenchido no modo profiling
+    queries: Optional[list[tuple[str, Any, float]]] = None
+
+
+# Estatísticas de SQL da requisição em andamento (None fora de uma requisição)
+current_sql_stats: ContextVar[Optional[RequestSQLStats]] = ContextVar('current_sql_stats', default=None)
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        for labels, value in self.values.items():
+            lines.append(f'{self.name}{_labels(label_names, labels)} {value}')
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = super().render(label_names)
+        lines[1] = f'# TYPE {self.name} gauge'
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # labels -> (contagem por bucket, soma, total)
+        self.values: dict[tuple, list[Any]] = {}
+
+    def observe(self, value: float, labels: tuple = ()) -> None:
+        entry = self.values.setdefault(labels, [[0] * len(self.buckets), 0.0, 0])
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            entry[0][index] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        for labels, (counts, total, count) in self.values.items():
+            acumulado = 0
+            for bucket, bucket_count in zip(self.buckets, counts):
+                acumulado += bucket_count
+                bucket_labels = _labels(label_names + ('le',), labels + (_format(bucket),))
+                lines.append(f'{self.name}_bucket{bucket_labels} {acumulado}')
+            lines.append(f'{self.name}_bucket{_labels(label_names + ("le",), labels + ("+Inf",))} {count}')
+            lines.append(f'{self.name}_sum{_labels(label_names, labels)} {total}')
+            lines.append(f'{self.name}_count{_labels(label_names, labels)} {count}')
+        return lines
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ''
+    pares = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pares + '}'
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_samples(
+    name: str, help: str, label_names: tuple[str, ...], samples: dict[tuple, float], counter: bool = False
+) -> list[str]:
+    """Renderiza valores lidos na hora da coleta (pool, cache...) como gauge ou counter."""
+    metric = Counter(name, help) if counter else Gauge(name, help)
+    metric.values = samples
+    return metric.render(label_names)
+
+
+ROUTE_LABELS = ('method', 'route')
+
+http_requests_total = Counter('http_requests_total', 'Total de requisições HTTP')
+http_request_duration_seconds = Histogram(
+    'http_request_duration_seconds', 'Latência das requisições HTTP', LATENCY_BUCKETS
+)
+http_requests_in_progress = Gauge('http_requests_in_progress', 'Requisições HTTP em andamento')
+http_response_size_bytes = Histogram('http_response_size_bytes', 'Tamanho do corpo das respostas', SIZE_BUCKETS)
+db_statements_per_request = Histogram(
+    'db_statements_per_request', 'Statements SQL executados por requisição', STATEMENT_BUCKETS
+)
+db_statements_total = Counter('db_statements_total', 'Total de statements SQL executados')
+db_statement_duration_seconds_total = Counter(
+    'db_statement_duration_seconds_total', 'Tempo total gasto em statements SQL'
+)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    end = time.perf_counter()
+    duration = end - conn.info['query_start'].pop()
+    stats = current_sql_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.duration += duration
+        stats.last_end = end
+        if stats.queries is not None:
+            stats.queries.append((statement, parameters, duration))
+
+    if settings.SQL_SLOW_QUERY_MS and duration * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        route = _route_label(stats.scope) if stats and stats.scope else '<fora de requisição>'
+        logger.warning('SQL lento (%.1f ms) em %s: %s', duration * 1000, route, _compact(statement))
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # Statement com erro não dispara after_cursor_execute; descarta o início pendente
+    if context.connection is not None and context.connection.info.get('query_start'):
+        context.connection.info['query_start'].pop()
+
+
+def _compact(statement: str) -> str:
+    return ' '.join(statement.split())
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get('route')
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+def _profiling_requested(scope: Scope) -> bool:
+    if settings.SQL_PROFILE:
+        return True
+    if not settings.SQL_PROFILE_TOKEN:
+        return False
+    for name, value in scope['headers']:
+        if name == b'x-sql-profile':
+            return hmac.compare_digest(value, settings.SQL_PROFILE_TOKEN.encode())
+    return False
+
+
+def _server_timing(stats: RequestSQLStats, start: float, now: float) -> str:
+    # db: tempo somado dos statements; serialize: do fim do último statement até os headers
+    parts = [f'db;dur={stats.duration * 1000:.2f};desc="{stats.statements} statements"']
+    if stats.last_end is not None:
+        parts.append(f'serialize;dur={(now - stats.last_end) * 1000:.2f}')
+    parts.append(f'total;dur={(now - start) * 1000:.2f}')
+    return ', '.join(parts)
+
+
+def _log_profile(scope: Scope, stats: RequestSQLStats, duration: float) -> None:
+    logger.info(
+        'Profile %s: %d statements, %.1f ms em SQL, %.1f ms no total',
+        _route_label(scope), stats.statements, stats.duration * 1000, duration * 1000,
+    )
+    for statement, parameters, statement_duration in stats.queries or []:
+        logger.info('  %.2f ms %s -- %.200r', statement_duration * 1000, _compact(statement), parameters)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que mede latência, tamanho da resposta e uso de SQL por rota.
+
+    Também faz o profiling opcional de SQL (SQL_PROFILE ou header X-SQL-Profile com o token),
+    logando cada statement da requisição e devolvendo o header Server-Timing.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status_code = 500
+        response_size = 0
+        profile = _profiling_requested(scope)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if profile:
+                    headers = MutableHeaders(scope=message)
+                    headers.append('Server-Timing', _server_timing(sql_stats, start, time.perf_counter()))
+            elif message['type'] == 'http.response.body':
+                response_size += len(message.get('body', b''))
+            await send(message)
+
+        sql_stats = RequestSQLStats(scope=scope, queries=[] if profile else None)
+        token = current_sql_stats.set(sql_stats)
+        http_requests_in_progress.inc((method,))
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            http_requests_in_progress.dec((method,))
+            current_sql_stats.reset(token)
+            if profile:
+                _log_profile(scope, sql_stats, duration)
+
+            # Usa o template da rota (/atleta/{id}) para não criar uma série por id
+            route = scope.get('route')
+            labels = (method, getattr(route, 'path', '<unmatched>'))
+            http_requests_total.inc(labels + (str(status_code),))
+            http_request_duration_seconds.observe(duration, labels)
+            http_response_size_bytes.observe(response_size, labels)
+            db_statements_per_request.observe(sql_stats.statements, labels)
+            db_statements_total.inc(labels, sql_stats.statements)
+            db_statement_duration_seconds_total.inc(labels, sql_stats.duration)
+
+
+def render_metrics(extra: Optional[list[str]] = None) -> str:
+    lines: list[str] = []
+    lines += http_requests_total.render(ROUTE_LABELS + ('status',))
+    lines += http_request_duration_seconds.render(ROUTE_LABELS)
+    lines += http_requests_in_progress.render(('method',))
+    lines += http_response_size_bytes.render(ROUTE_LABELS)
+    lines += db_statements_per_request.render(ROUTE_LABELS)
+    lines += db_statements_total.render(ROUTE_LABELS)
+    lines += db_statement_duration_seconds_total.render(ROUTE_LABELS)
+    lines += extra or []
+    return '\n'.join(lines) + '\n'
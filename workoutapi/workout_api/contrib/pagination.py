@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+@dataclass
+class PageParams:
+    limit: int = DEFAULT_LIMIT
+    cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    payload = json.dumps([created_at.isoformat(), str(id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor de paginação inválido'
+        )
+
+
+async def paginate(
+    db_session: AsyncSession, stmt: Select, model: Any, params: PageParams, scalars: bool = True
+) -> tuple[list[Any], Optional[str]]:
+    """Executa `stmt` paginado por (created_at, id) a partir do cursor.
+
+    Busca `limit + 1` linhas para saber se há próxima página sem usar COUNT/OFFSET.
+    Com `scalars=False` devolve as linhas (para SELECTs de colunas), que precisam
+    incluir created_at e id.
+    """
+    if params.cursor:
+        created_at, id = decode_cursor(params.cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) > tuple_(created_at, id))
+
+    stmt = stmt.order_by(model.created_at, model.id).limit(params.limit + 1)
+    result = await db_session.execute(stmt)
+    rows = list(result.scalars().all() if scalars else result.all())
+
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return rows, next_cursor
@@ -0,0 +1,195 @@
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from workout_api.configs.settings import settings
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: `rate` requisições por segundo, com rajadas de até `burst`."""
+
+    rate: float
+    burst: int
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Orçamento próprio para as requisições `method` em `path_prefix` ou abaixo dele.
+
+    A comparação é por segmento: '/atleta/bulk' vale para '/atleta/bulk/...', mas não
+    para '/atleta/bulk-delete'.
+    """
+
+    method: str
+    path_prefix: str
+    limit: RateLimit
+
+    @property
+    def name(self) -> str:
+        return f'{self.method} {self.path_prefix}'
+
+    def matches(self, method: str, path: str) -> bool:
+        return method == self.method and (
+            path == self.path_prefix or path.startswith(self.path_prefix.rstrip('/') + '/')
+        )
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimitBackend(ABC):
+    """Armazena os buckets. A implementação em memória vale por processo; um backend
+    compartilhado (ex. Redis) precisa fazer o consumo de forma atômica no servidor."""
+
+    @abstractmethod
+    async def consume(self, key: str, limit: RateLimit) -> RateLimitResult:
+        ...
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets em memória, no máximo `maxsize` (os menos usados recentemente saem primeiro)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, limit: RateLimit) -> RateLimitResult:
+        agora = time.monotonic()
+        tokens, ultimo = self._buckets.get(key, (float(limit.burst), agora))
+        tokens = min(float(limit.burst), tokens + (agora - ultimo) * limit.rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, agora)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+
+        retry_after = 0.0 if allowed else (1 - tokens) / limit.rate
+        return RateLimitResult(allowed=allowed, remaining=int(tokens), retry_after=retry_after)
+
+
+def client_key(scope: Scope) -> str:
+    # Com proxy_headers (workout_api.server), o uvicorn já troca pelo X-Forwarded-For quando a
+    # conexão vem de um proxy em API_FORWARDED_ALLOW_IPS
+    client = scope.get('client')
+    return client[0] if client else 'desconhecido'
+
+
+class RateLimitMiddleware:
+    """Middleware ASGI com token bucket por cliente: um orçamento por regra de rota
+    (a primeira que casar) e o `default` para as demais. Devolve 429 com Retry-After."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: RateLimitBackend,
+        default: RateLimit,
+        rules: tuple[RateLimitRule, ...] = (),
+        exempt: tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.backend = backend
+        self.default = default
+        self.rules = rules
+        self.exempt = exempt
+
+    def _rule(self, scope: Scope) -> tuple[str, RateLimit]:
+        for rule in self.rules:
+            if rule.matches(scope['method'], scope['path']):
+                return rule.name, rule.limit
+        return 'default', self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['path'].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+
+        nome, limit = self._rule(scope)
+        result = await self.backend.consume(f'{nome}|{client_key(scope)}', limit)
+        if result.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            {'detail': 'Limite de requisições excedido, tente novamente mais tarde'},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(math.ceil(result.retry_after)), 'X-RateLimit-Limit': str(limit.burst)},
+        )
+        await response(scope, receive, send)
+
+
+class DatabaseConcurrencyLimiter:
+    """Limita as requisições que usam o banco ao mesmo tempo, no total e por cliente.
+
+    Acima do limite a requisição falha logo (503 no total, 429 por cliente) em vez de
+    ficar na fila do pool até DB_POOL_TIMEOUT, segurando o worker e a conexão do cliente.
+    """
+
+    def __init__(self, limit: int, per_client: int, wait: float):
+        self.limit = limit
+        self.per_client = per_client
+        self.wait = wait
+        self.active = 0
+        self.rejected = {'total': 0, 'cliente': 0}
+        self._semaphore = asyncio.Semaphore(limit)
+        self._por_cliente: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def slot(self, client: str) -> AsyncIterator[None]:
+        if self.per_client and self._por_cliente.get(client, 0) >= self.per_client:
+            self.rejected['cliente'] += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail='Muitas requisições simultâneas deste cliente',
+                headers={'Retry-After': '1'},
+            )
+
+        self._por_cliente[client] = self._por_cliente.get(client, 0) + 1
+        try:
+            # asyncio.timeout cancela o acquire na própria task: sem a corrida do wait_for,
+            # em que a vaga podia ser obtida depois do timeout e nunca devolvida
+            try:
+                async with asyncio.timeout(self.wait):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                self.rejected['total'] += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail='Banco de dados sobrecarregado, tente novamente em instantes',
+                    headers={'Retry-After': '1'},
+                )
+            self.active += 1
+            try:
+                yield
+            finally:
+                self.active -= 1
+                self._semaphore.release()
+        finally:
+            restantes = self._por_cliente[client] - 1
+            if restantes:
+                self._por_cliente[client] = restantes
+            else:
+                del self._por_cliente[client]
+
+
+def create_database_limiter() -> DatabaseConcurrencyLimiter:
+    # Sem limite explícito, a capacidade do pool do primário
+    limit = settings.DB_MAX_CONCURRENT_REQUESTS or settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    return DatabaseConcurrencyLimiter(
+        limit, per_client=settings.DB_MAX_CONCURRENT_PER_CLIENT, wait=settings.DB_CONCURRENCY_WAIT_SECONDS
+    )
@@ -0,0 +1,99 @@
+from typing import Any, AsyncIterator, Hashable, Optional, Sequence
+
+from sqlalchemy import Select, literal, select
+from sqlalchemy.orm import joinedload
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.repository.base import Repository
+
+
+class AtletaRepository(Repository[AtletaModel]):
+    model = AtletaModel
+
+    def select(self) -> Select:
+        # Carrega categoria e centro de treinamento no mesmo SELECT (evita N+1)
+        return select(AtletaModel).options(
+            joinedload(AtletaModel.categoria, innerjoin=True),
+            joinedload(AtletaModel.centro_treinamento, innerjoin=True),
+        )
+
+    def select_colunas(self, colunas: Sequence[str]) -> Select:
+        return select(*(getattr(AtletaModel, coluna) for coluna in colunas))
+
+    def filtrar(
+        self,
+        stmt: Select,
+        nome: Optional[str] = None,
+        cpf: Optional[str] = None,
+        categoria: Optional[str] = None,
+        centro_treinamento: Optional[str] = None,
+    ) -> Select:
+        if nome:
+            stmt = stmt.where(AtletaModel.nome == nome)
+        if cpf:
+            stmt = stmt.where(AtletaModel.cpf == cpf)
+        # Filtra pela FK (indexada) resolvendo o nome em uma subquery
+        if categoria:
+            stmt = stmt.where(AtletaModel.categoria_id == (
+                select(CategoriaModel.id).where(CategoriaModel.nome == categoria).scalar_subquery()
+            ))
+        if centro_treinamento:
+            stmt = stmt.where(AtletaModel.centro_treinamento_id == (
+                select(CentroTreinamentoModel.id)
+                .where(CentroTreinamentoModel.nome == centro_treinamento)
+                .scalar_subquery()
+            ))
+        return stmt
+
+    def condicoes(
+        self,
+        ids: Optional[Sequence[Hashable]] = None,
+        categoria_id: Optional[Hashable] = None,
+        centro_treinamento_id: Optional[Hashable] = None,
+    ) -> list[Any]:
+        """Critérios das operações em massa, combinados com AND (lista vazia sem critério)."""
+        condicoes = []
+        if ids is not None:
+            condicoes.append(self.id_in(ids))
+        if categoria_id is not None:
+            condicoes.append(AtletaModel.categoria_id == categoria_id)
+        if centro_treinamento_id is not None:
+            condicoes.append(AtletaModel.centro_treinamento_id == centro_treinamento_id)
+        return condicoes
+
+    async def search(self, q: str, offset: int, limit: int) -> list[AtletaModel]:
+        stmt = self.select()
+
+        if q.isdigit():
+            # Prefixo do CPF como faixa (cpf >= '129' AND cpf < '130'): usa o índice único de cpf
+            # mesmo com statement preparado, o que não acontece com LIKE '129%'
+            stmt = stmt.where(AtletaModel.cpf >= q)
+            fim = str(int(q) + 1).zfill(len(q))
+            if len(fim) == len(q):
+                stmt = stmt.where(AtletaModel.cpf < fim)
+            stmt = stmt.order_by(AtletaModel.cpf)
+        else:
+            stmt = stmt.where(AtletaModel.nome.icontains(q, autoescape=True))
+            if self.session.get_bind().dialect.name == 'postgresql':
+                # Distância de palavra do pg_trgm (0 = q aparece inteiro no nome); o índice GiST
+                # devolve as linhas já nessa ordem, sem ordenar todos os nomes que casam
+                stmt = stmt.order_by(literal(q).op('<<->')(AtletaModel.nome), AtletaModel.id)
+            else:
+                stmt = stmt.order_by(AtletaModel.nome, AtletaModel.id)
+
+        return list((await self.session.execute(stmt.offset(offset).limit(limit))).scalars().all())
+
+    async def stream(self, batch_size: int) -> AsyncIterator[list[AtletaModel]]:
+        """Todos os atletas (com as relações) em lotes de `batch_size`, por (created_at, id)."""
+        stmt = (
+            self.select()
+            .order_by(AtletaModel.created_at, AtletaModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for partition in result.scalars().partitions():
+            yield partition
+            # Libera as instâncias já entregues para manter a memória constante
+            self.session.expunge_all()
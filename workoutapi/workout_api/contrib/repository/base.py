@@ -0,0 +1,201 @@
+from typing import TYPE_CHECKING, Any, Generic, Hashable, Iterable, Optional, Sequence, TypeVar
+
+from sqlalchemy import Select, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import ColumnElement
+
+from workout_api.contrib.batch import fetch_by_ids, id_in
+from workout_api.contrib.cache import ReferenceCache
+from workout_api.contrib.models import BaseModel
+from workout_api.contrib.pagination import PageParams, paginate
+
+if TYPE_CHECKING:
+    from workout_api.contrib.repository.unit_of_work import UnitOfWork
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+SchemaT = TypeVar('SchemaT')
+
+
+class Repository(Generic[ModelT]):
+    """Acesso a uma tabela sobre a sessão de um UnitOfWork.
+
+    Nenhum método faz commit: as escritas só executam o statement e quem confirma a
+    transação (uma vez por requisição) é o UnitOfWork. As escritas usam RETURNING, então
+    o resultado volta no mesmo round trip, sem refresh nem SELECT depois do commit. Sem
+    `returning`, voltam todas as colunas da tabela.
+    """
+
+    model: type[ModelT]
+
+    def __init__(self, uow: 'UnitOfWork'):
+        self.uow = uow
+        self.session = uow.session
+
+    def select(self) -> Select:
+        return select(self.model)
+
+    def id_in(self, ids: Sequence[Hashable]) -> ColumnElement[bool]:
+        return id_in(self.session, self.model.id, ids)
+
+    def _returning(self, returning: Optional[Iterable[Any]]) -> tuple[Any, ...]:
+        return tuple(returning) if returning is not None else tuple(self.model.__table__.columns)
+
+    async def get(self, id: Hashable) -> Optional[ModelT]:
+        return (await self.session.execute(self.select().where(self.model.id == id))).scalars().first()
+
+    async def get_many(self, ids: Sequence[Hashable]) -> dict[Any, ModelT]:
+        """Todos os ids em um único SELECT, indexados por id (os inexistentes ficam de fora)."""
+        return await fetch_by_ids(self.session, self.select(), self.model.id, ids)
+
+    async def page(self, stmt: Select, params: PageParams, scalars: bool = True) -> tuple[list[Any], Optional[str]]:
+        return await paginate(self.session, stmt, self.model, params, scalars=scalars)
+
+    async def insert(
+        self, values: dict[str, Any], conflict: Optional[Any] = None, returning: Optional[Iterable[Any]] = None
+    ) -> Optional[Row]:
+        """INSERT ... RETURNING. Com `conflict` (coluna única), um registro já existente é
+        ignorado (ON CONFLICT DO NOTHING) e o retorno é None, sem SELECT prévio."""
+        stmt = insert(self.model).values(**values)
+        if conflict is not None:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[conflict])
+        return (await self.session.execute(stmt.returning(*self._returning(returning)))).first()
+
+    async def insert_many(
+        self, values: list[dict[str, Any]], conflict: Optional[Any] = None, returning: Optional[Iterable[Any]] = None
+    ) -> list[Row]:
+        """Como `insert`, para várias linhas em um statement; as ignoradas pelo conflito
+        ficam de fora do retorno."""
+        stmt = insert(self.model)
+        if conflict is not None:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[conflict])
+        return list((await self.session.execute(stmt.returning(*self._returning(returning)), values)).all())
+
+    async def update(
+        self, id: Hashable, values: dict[str, Any], returning: Optional[Iterable[Any]] = None
+    ) -> Optional[Row]:
+        """UPDATE ... WHERE id RETURNING, sem carregar o registro antes; None se o id não existe."""
+        rows = await self.update_where([self.model.id == id], values, returning)
+        return rows[0] if rows else None
+
+    async def update_where(
+        self, condicoes: list[Any], values: dict[str, Any], returning: Optional[Iterable[Any]] = None
+    ) -> list[Row]:
+        # updated_at entra pelo onupdate da coluna
+        stmt = (
+            update(self.model)
+            .where(*condicoes)
+            .values(**values)
+            .returning(*self._returning(returning))
+            .execution_options(synchronize_session=False)
+        )
+        return list((await self.session.execute(stmt)).all())
+
+    async def delete(self, id: Hashable, returning: Optional[Iterable[Any]] = None) -> Optional[Row]:
+        """DELETE ... WHERE id RETURNING; None se o id não existe."""
+        rows = await self.delete_where([self.model.id == id], returning)
+        return rows[0] if rows else None
+
+    async def delete_where(self, condicoes: list[Any], returning: Optional[Iterable[Any]] = None) -> list[Row]:
+        stmt = (
+            delete(self.model)
+            .where(*condicoes)
+            .returning(*self._returning(returning))
+            .execution_options(synchronize_session=False)
+        )
+        return list((await self.session.execute(stmt)).all())
+
+
+class ReferenceRepository(Repository[ModelT], Generic[ModelT, SchemaT]):
+    """Repositório das entidades de referência (categoria, centro), que passam pelo ReferenceCache.
+
+    As leituras por id ou nome só vão ao banco para o que não está em cache, em um
+    único SELECT. As escritas invalidam o cache depois do commit (UnitOfWork.after_commit),
+    para uma leitura concorrente não guardar de novo o valor antigo. Pelo mesmo motivo, o
+    que vem de uma réplica (possivelmente atrasada) não entra no cache.
+    """
+
+    schema: type[SchemaT]
+    cache: ReferenceCache
+
+    def to_schema(self, registro: Any) -> SchemaT:
+        return self.schema.model_validate(registro)
+
+    def _guardar(self, registro_out: SchemaT) -> None:
+        if not self.session.info.get('replica'):
+            self.cache.set(registro_out)
+
+    async def by_id(self, id: Hashable) -> Optional[SchemaT]:
+        return (await self.by_ids([id])).get(id)
+
+    async def by_ids(self, ids: Iterable[Hashable]) -> dict[Any, SchemaT]:
+        encontrados = {}
+        faltando = []
+        for id in dict.fromkeys(ids):
+            cached = self.cache.get_by_id(id)
+            if cached:
+                encontrados[id] = cached
+            else:
+                faltando.append(id)
+
+        if faltando:
+            for registro in (await self.get_many(faltando)).values():
+                registro_out = self.to_schema(registro)
+                self._guardar(registro_out)
+                encontrados[registro_out.id] = registro_out
+
+        return encontrados
+
+    async def by_nomes(self, nomes: Iterable[str]) -> dict[str, SchemaT]:
+        encontrados = {}
+        faltando = set()
+        for nome in nomes:
+            cached = self.cache.get_by_nome(nome)
+            if cached:
+                encontrados[nome] = cached
+            else:
+                faltando.add(nome)
+
+        if faltando:
+            registros = (await self.session.execute(
+                self.select().where(self.model.nome.in_(faltando))
+            )).scalars()
+            for registro in registros:
+                registro_out = self.to_schema(registro)
+                self._guardar(registro_out)
+                encontrados[registro_out.nome] = registro_out
+
+        return encontrados
+
+    async def create(self, values: dict[str, Any]) -> Optional[SchemaT]:
+        """Cria o registro; None se o nome já existe (índice único)."""
+        registro = await self.insert(values, conflict=self.model.nome)
+        if registro is None:
+            return None
+        self.uow.after_commit(lambda: self.cache.invalidate(nome=registro.nome))
+        return self.to_schema(registro)
+
+    async def update(
+        self, id: Hashable, values: dict[str, Any], returning: Optional[Iterable[Any]] = None
+    ) -> Optional[Row]:
+        # O alias lê a linha como estava antes do UPDATE: o nome anterior (para invalidar
+        # o cache) volta no RETURNING, sem um SELECT antes
+        anterior = aliased(self.model)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, anterior.id == self.model.id)
+            .values(**values)
+            .returning(*self._returning(returning), anterior.nome.label('nome_anterior'))
+            .execution_options(synchronize_session=False)
+        )
+        registro = (await self.session.execute(stmt)).first()
+        if registro is not None:
+            self.uow.after_commit(lambda: self.cache.invalidate(id=id, nome=registro.nome_anterior))
+        return registro
+
+    async def delete(self, id: Hashable, returning: Optional[Iterable[Any]] = None) -> Optional[Row]:
+        registro = await super().delete(id, returning)
+        if registro is not None:
+            self.uow.after_commit(lambda: self.cache.invalidate(id=id, nome=registro.nome))
+        return registro
@@ -0,0 +1,10 @@
+from workout_api.categorias.models import CategoriaModel
+from workout_api.categorias.schemas import CategoriaOut
+from workout_api.contrib.cache import categoria_cache
+from workout_api.contrib.repository.base import ReferenceRepository
+
+
+class CategoriaRepository(ReferenceRepository[CategoriaModel, CategoriaOut]):
+    model = CategoriaModel
+    schema = CategoriaOut
+    cache = categoria_cache
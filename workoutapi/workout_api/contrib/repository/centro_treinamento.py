@@ -0,0 +1,10 @@
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.centro_treinamento.schemas import CentroTreinamentoOut
+from workout_api.contrib.cache import centro_treinamento_cache
+from workout_api.contrib.repository.base import ReferenceRepository
+
+
+class CentroTreinamentoRepository(ReferenceRepository[CentroTreinamentoModel, CentroTreinamentoOut]):
+    model = CentroTreinamentoModel
+    schema = CentroTreinamentoOut
+    cache = centro_treinamento_cache
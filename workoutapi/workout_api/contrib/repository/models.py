@@ -1,4 +1,6 @@
 from workout_api.contrib.models import BaseModel
 from workout_api.atleta.models import AtletaModel
 from workout_api.categorias.models import CategoriaModel
-from workout_api.centro_treinamento.models import CentroTreinamentoModel
\ No newline at end of file
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.estatisticas.models import AtletaResumoModel
+from workout_api.jobs.models import JobModel
@@ -0,0 +1,43 @@
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.repository.atleta import AtletaRepository
+from workout_api.contrib.repository.categoria import CategoriaRepository
+from workout_api.contrib.repository.centro_treinamento import CentroTreinamentoRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWork:
+    """Os repositórios de uma requisição sobre uma única sessão, com um único commit.
+
+    Os repositórios só executam statements; `commit` confirma tudo de uma vez e depois
+    roda os callbacks de `after_commit` (ex. invalidar os caches de referência). Sem
+    commit, a sessão faz rollback ao ser fechada e os callbacks são descartados.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._after_commit: list[Callable[[], None]] = []
+        self.atletas = AtletaRepository(self)
+        self.categorias = CategoriaRepository(self)
+        self.centros_treinamento = CentroTreinamentoRepository(self)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # A transação já foi confirmada; um callback com erro não muda a resposta
+                logger.exception('Erro em callback após o commit')
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        await self.session.rollback()
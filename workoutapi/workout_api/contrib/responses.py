@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class SchemaResponse(ORJSONResponse):
+    """Resposta JSON para schemas já montados (e validados) no controller.
+
+    Schemas pydantic são serializados direto para bytes pelo pydantic-core, sem o dict
+    intermediário; demais conteúdos seguem pelo orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
+
+
+def schema_response(
+    content: BaseModel, response: Optional[Response] = None, status_code: int = status.HTTP_200_OK
+) -> SchemaResponse:
+    """Devolve o schema como Response, o que faz o FastAPI pular a revalidação pelo response_model.
+
+    Os headers definidos na Response injetada no endpoint (ETag, Cache-Control...) são copiados,
+    pois o FastAPI só os aplica quando o endpoint não devolve uma Response própria.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return SchemaResponse(content, status_code=status_code, headers=headers)
@@ -1,6 +1,9 @@
-from typing import Annotated
-from pydantic import BaseModel, Field
+from typing import Annotated, Generic, Optional, TypeVar
+from pydantic import BaseModel, Field, UUID4, field_validator
 from datetime import datetime
+from workout_api.contrib.batch import BATCH_MAX_IDS
+
+T = TypeVar("T")
 
 
 class BaseSchema(BaseModel):
@@ -8,7 +11,28 @@ class BaseSchema(BaseModel):
     extra = "forbid"
     from_attributes = True
 
+class PartialSchema(BaseSchema):
+  """Corpo de atualização parcial: campo omitido fica como está; null explícito é
+  rejeitado (422), pois as colunas são NOT NULL."""
+
+  @field_validator('*', mode='before')
+  @classmethod
+  def _rejeitar_nulo(cls, value):
+    if value is None:
+      raise ValueError('null não é permitido; omita o campo para mantê-lo')
+    return value
+
 class OutMixin(BaseSchema):
-  pk_id: Annotated[int, Field(description="ID do registro", example=1)]
   created_at: Annotated[datetime, Field(description="Data de criação do registro", example=datetime.now())]
   updated_at: Annotated[datetime, Field(description="Data de atualização do registro", example=datetime.now())]
+
+class Page(BaseModel, Generic[T]):
+  items: Annotated[list[T], Field(description="Registros da página")]
+  next_cursor: Annotated[Optional[str], Field(None, description="Cursor para a próxima página (null na última)")]
+
+class BatchGetIn(BaseSchema):
+  ids: Annotated[list[UUID4], Field(description="IDs a buscar (a resposta segue esta ordem)", min_length=1, max_length=BATCH_MAX_IDS)]
+
+class BatchGetOut(BaseModel, Generic[T]):
+  items: Annotated[list[Optional[T]], Field(description="Registro de cada id, na ordem enviada (null se o id não existe)")]
+  missing: Annotated[list[UUID4], Field(description="IDs não encontrados")]
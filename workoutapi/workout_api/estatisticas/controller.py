@@ -0,0 +1,110 @@
+from typing import Any
+from fastapi import APIRouter, status
+from sqlalchemy import and_, func, select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import ReadDatabaseDependency
+from workout_api.contrib.responses import schema_response
+from workout_api.estatisticas.models import AtletaResumoModel
+from workout_api.estatisticas.schemas import DistribuicaoImc, EstatisticasGrupoOut, EstatisticasOut
+
+api_router = APIRouter()
+
+# Limites das faixas de IMC; os triggers de atletas_resumo usam os mesmos valores
+IMC_FAIXAS = (18.5, 25, 30)
+
+RESUMO_COLUNAS = (
+    'total', 'soma_idade', 'soma_peso', 'soma_altura', 'soma_imc',
+    'imc_abaixo_do_peso', 'imc_normal', 'imc_sobrepeso', 'imc_obesidade',
+)
+
+
+def _agregados() -> tuple:
+    """Somas e contagens com os mesmos rótulos, calculadas sobre atletas ou sobre atletas_resumo."""
+    if settings.STATS_USE_SUMMARY:
+        return tuple(func.sum(getattr(AtletaResumoModel, coluna)).label(coluna) for coluna in RESUMO_COLUNAS)
+
+    imc = AtletaModel.peso / (AtletaModel.altura * AtletaModel.altura)
+    abaixo, normal, sobrepeso = IMC_FAIXAS
+    return (
+        func.count(AtletaModel.id).label('total'),
+        func.sum(AtletaModel.idade).label('soma_idade'),
+        func.sum(AtletaModel.peso).label('soma_peso'),
+        func.sum(AtletaModel.altura).label('soma_altura'),
+        func.sum(imc).label('soma_imc'),
+        func.count().filter(imc < abaixo).label('imc_abaixo_do_peso'),
+        func.count().filter(and_(imc >= abaixo, imc < normal)).label('imc_normal'),
+        func.count().filter(and_(imc >= normal, imc < sobrepeso)).label('imc_sobrepeso'),
+        func.count().filter(imc >= sobrepeso).label('imc_obesidade'),
+    )
+
+
+def _estatisticas(row: Any) -> dict[str, Any]:
+    total = row.total or 0
+
+    def media(soma: Any) -> Any:
+        return round(float(soma) / total, 2) if total else None
+
+    return dict(
+        total=total,
+        idade_media=media(row.soma_idade),
+        peso_medio=media(row.soma_peso),
+        altura_media=media(row.soma_altura),
+        imc_medio=media(row.soma_imc),
+        imc=DistribuicaoImc(
+            abaixo_do_peso=row.imc_abaixo_do_peso or 0,
+            normal=row.imc_normal or 0,
+            sobrepeso=row.imc_sobrepeso or 0,
+            obesidade=row.imc_obesidade or 0,
+        ),
+    )
+
+
+async def _por_grupo(db_session: ReadDatabaseDependency, grupo: Any, coluna: str) -> list[EstatisticasGrupoOut]:
+    fonte = AtletaResumoModel if settings.STATS_USE_SUMMARY else AtletaModel
+    stmt = (
+        select(grupo.id, grupo.nome, *_agregados())
+        .join_from(grupo, fonte, getattr(fonte, coluna) == grupo.id)
+        .group_by(grupo.id, grupo.nome)
+        .order_by(grupo.nome)
+    )
+    if settings.STATS_USE_SUMMARY:
+        # Combinações cujos atletas foram todos removidos ficam com total 0
+        stmt = stmt.having(func.sum(AtletaResumoModel.total) > 0)
+
+    rows = (await db_session.execute(stmt)).all()
+    return [EstatisticasGrupoOut(id=row.id, nome=row.nome, **_estatisticas(row)) for row in rows]
+
+
+@api_router.get(
+    '/',
+    summary='Estatísticas gerais dos atletas',
+    status_code=status.HTTP_200_OK,
+    response_model=EstatisticasOut,
+)
+async def estatisticas_gerais(db_session: ReadDatabaseDependency) -> EstatisticasOut:
+    row = (await db_session.execute(select(*_agregados()))).one()
+    return schema_response(EstatisticasOut(**_estatisticas(row)))
+
+
+@api_router.get(
+    '/categorias',
+    summary='Estatísticas dos atletas por categoria',
+    status_code=status.HTTP_200_OK,
+    response_model=list[EstatisticasGrupoOut],
+)
+async def estatisticas_por_categoria(db_session: ReadDatabaseDependency) -> list[EstatisticasGrupoOut]:
+    return await _por_grupo(db_session, CategoriaModel, 'categoria_id')
+
+
+@api_router.get(
+    '/centros_treinamento',
+    summary='Estatísticas dos atletas por centro de treinamento',
+    status_code=status.HTTP_200_OK,
+    response_model=list[EstatisticasGrupoOut],
+)
+async def estatisticas_por_centro_treinamento(db_session: ReadDatabaseDependency) -> list[EstatisticasGrupoOut]:
+    return await _por_grupo(db_session, CentroTreinamentoModel, 'centro_treinamento_id')
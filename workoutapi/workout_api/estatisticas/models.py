@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from workout_api.contrib.models import Base
+
+
+class AtletaResumoModel(Base):
+    """Somas e contagens de atletas por (categoria, centro de treinamento).
+
+    Mantida de forma incremental por triggers em `atletas` (migração 5d7a1c3e9f20), para que
+    /stats agregue poucas linhas em vez da tabela inteira. As faixas de IMC seguem IMC_FAIXAS.
+    """
+    __tablename__ = "atletas_resumo"
+
+    categoria_id = Column(UUID(as_uuid=True), ForeignKey("categorias.id", ondelete="CASCADE"), primary_key=True)
+    centro_treinamento_id = Column(
+        UUID(as_uuid=True), ForeignKey("centro_treinamento.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    total = Column(Integer, nullable=False, default=0)
+    soma_idade = Column(Float, nullable=False, default=0)
+    soma_peso = Column(Float, nullable=False, default=0)
+    soma_altura = Column(Float, nullable=False, default=0)
+    soma_imc = Column(Float, nullable=False, default=0)
+    imc_abaixo_do_peso = Column(Integer, nullable=False, default=0)
+    imc_normal = Column(Integer, nullable=False, default=0)
+    imc_sobrepeso = Column(Integer, nullable=False, default=0)
+    imc_obesidade = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,24 @@
+from typing import Annotated, Optional
+from pydantic import Field, UUID4
+from workout_api.contrib.schemas import BaseSchema
+
+
+class DistribuicaoImc(BaseSchema):
+    abaixo_do_peso: Annotated[int, Field(description="IMC abaixo de 18,5")]
+    normal: Annotated[int, Field(description="IMC de 18,5 a 24,9")]
+    sobrepeso: Annotated[int, Field(description="IMC de 25 a 29,9")]
+    obesidade: Annotated[int, Field(description="IMC de 30 ou mais")]
+
+
+class EstatisticasOut(BaseSchema):
+    total: Annotated[int, Field(description="Quantidade de atletas", example=120)]
+    idade_media: Annotated[Optional[float], Field(description="Idade média", example=27.4)]
+    peso_medio: Annotated[Optional[float], Field(description="Peso médio", example=74.2)]
+    altura_media: Annotated[Optional[float], Field(description="Altura média", example=1.76)]
+    imc_medio: Annotated[Optional[float], Field(description="IMC médio", example=23.9)]
+    imc: Annotated[DistribuicaoImc, Field(description="Atletas por faixa de IMC")]
+
+
+class EstatisticasGrupoOut(EstatisticasOut):
+    id: Annotated[UUID4, Field(description="ID da categoria ou do centro de treinamento")]
+    nome: Annotated[str, Field(description="Nome da categoria ou do centro de treinamento")]
@@ -0,0 +1,26 @@
+"""Executa só o pool de jobs, fora dos processos da API.
+
+    JOBS_ENABLED=false uvicorn workout_api.main:app ...   # API sem workers
+    python -m workout_api.jobs                           # workers em outro processo/container
+"""
+import asyncio
+import logging
+import signal
+
+from workout_api.jobs.worker import job_pool
+
+
+async def main() -> None:
+    parar = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sinal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sinal, parar.set)
+
+    await job_pool.start()
+    await parar.wait()
+    await job_pool.stop()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
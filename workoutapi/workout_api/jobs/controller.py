@@ -0,0 +1,93 @@
+import os
+from fastapi import APIRouter, Body, HTTPException, status
+from fastapi.responses import FileResponse
+from pydantic import UUID4, ValidationError
+from sqlalchemy import select
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.responses import schema_response
+from workout_api.jobs.models import JobModel
+from workout_api.jobs.registry import JOB_HANDLERS
+from workout_api.jobs.schemas import JobIn, JobOut
+from workout_api.jobs.worker import job_pool, load_handlers
+
+api_router = APIRouter()
+
+load_handlers()
+
+
+@api_router.post(
+    '/',
+    summary='Submeter um job em segundo plano',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+)
+async def submit(db_session: DatabaseDependency, job_in: JobIn = Body(...)) -> JobOut:
+    spec = JOB_HANDLERS.get(job_in.tipo)
+    if not spec:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Tipo de job desconhecido: {job_in.tipo}. Tipos disponíveis: {", ".join(sorted(JOB_HANDLERS))}'
+        )
+
+    # Valida os parâmetros já na submissão, para o erro não aparecer só na execução
+    try:
+        spec.params_schema.model_validate(job_in.params)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+
+    job = JobModel(tipo=job_in.tipo, params=job_in.params, status='pendente', progresso=0)
+    db_session.add(job)
+    await db_session.commit()
+    job_pool.notify()
+
+    return schema_response(JobOut.model_validate(job), status_code=status.HTTP_202_ACCEPTED)
+
+
+async def _get_job(db_session: DatabaseDependency, id: UUID4) -> JobModel:
+    job = (await db_session.execute(select(JobModel).where(JobModel.id == id))).scalars().first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Job não encontrado no id: {id}'
+        )
+    return job
+
+
+@api_router.get(
+    '/{id}',
+    summary='Consultar situação e progresso de um job',
+    status_code=status.HTTP_200_OK,
+    response_model=JobOut,
+)
+async def get(id: UUID4, db_session: DatabaseDependency) -> JobOut:
+    # Lê do primário: o status muda a todo momento e réplicas podem estar atrasadas
+    return schema_response(JobOut.model_validate(await _get_job(db_session, id)))
+
+
+@api_router.get(
+    '/{id}/arquivo',
+    summary='Baixar o arquivo gerado por um job',
+    status_code=status.HTTP_200_OK,
+    response_class=FileResponse,
+)
+async def download(id: UUID4, db_session: DatabaseDependency) -> FileResponse:
+    job = await _get_job(db_session, id)
+    arquivo = (job.resultado or {}).get('arquivo')
+    if job.status != 'concluido' or not arquivo:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'O job {id} não gerou um arquivo (status: {job.status})'
+        )
+
+    caminho = os.path.join(settings.JOBS_OUTPUT_DIR, arquivo)
+    if not os.path.exists(caminho):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail='O arquivo do job não está mais disponível'
+        )
+    return FileResponse(caminho, filename=arquivo)
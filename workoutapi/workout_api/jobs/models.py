@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+from workout_api.contrib.models import BaseModel
+
+
+class JobModel(BaseModel):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Busca do próximo job pendente pelos workers
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+    )
+
+    tipo = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="pendente")
+    params = Column(JSON, nullable=False, default=dict)
+    progresso = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    resultado = Column(JSON, nullable=True)
+    erro = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Também serve de heartbeat: é atualizado a cada progresso reportado
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
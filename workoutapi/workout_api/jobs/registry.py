@@ -0,0 +1,55 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from workout_api.jobs.models import JobModel
+
+logger = logging.getLogger('workout_api.jobs')
+
+
+@dataclass
+class JobContext:
+    """Dados do job em execução entregues ao handler."""
+    job_id: UUID
+    session_factory: sessionmaker
+
+    async def progresso(self, processados: int, total: Optional[int] = None) -> None:
+        """Registra o progresso (e renova o heartbeat do job) em uma transação curta.
+
+        Falhas aqui só são logadas: o progresso é informativo e não deve derrubar o job.
+        """
+        valores: dict[str, Any] = {'progresso': processados, 'updated_at': datetime.utcnow()}
+        if total is not None:
+            valores['total'] = total
+        try:
+            async with self.session_factory() as session:
+                await session.execute(update(JobModel).where(JobModel.id == self.job_id).values(**valores))
+                await session.commit()
+        except Exception:
+            logger.warning('Não foi possível registrar o progresso do job %s', self.job_id, exc_info=True)
+
+
+JobHandler = Callable[[JobContext, Any], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class JobSpec:
+    handler: JobHandler
+    params_schema: type[BaseModel]
+
+
+JOB_HANDLERS: dict[str, JobSpec] = {}
+
+
+def register_job(tipo: str, params_schema: type[BaseModel]) -> Callable[[JobHandler], JobHandler]:
+    """Registra um handler; os params do job são validados com `params_schema` na submissão."""
+    def decorator(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[tipo] = JobSpec(handler=handler, params_schema=params_schema)
+        return handler
+    return decorator
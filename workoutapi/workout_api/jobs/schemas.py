@@ -0,0 +1,23 @@
+from typing import Annotated, Any, Literal, Optional
+from datetime import datetime
+from pydantic import Field, UUID4
+from workout_api.contrib.schemas import BaseSchema, OutMixin
+
+JobStatus = Literal["pendente", "executando", "concluido", "erro"]
+
+
+class JobIn(BaseSchema):
+    tipo: Annotated[str, Field(description="Tipo do job", example="atletas_export")]
+    params: Annotated[dict[str, Any], Field(default_factory=dict, description="Parâmetros do job", example={"format": "csv"})]
+
+
+class JobOut(OutMixin):
+    id: Annotated[UUID4, Field(description="ID do job")]
+    tipo: Annotated[str, Field(description="Tipo do job")]
+    status: Annotated[JobStatus, Field(description="Situação do job")]
+    progresso: Annotated[int, Field(description="Itens já processados")]
+    total: Annotated[Optional[int], Field(None, description="Total de itens (quando conhecido)")]
+    resultado: Annotated[Optional[dict[str, Any]], Field(None, description="Resultado do job concluído")]
+    erro: Annotated[Optional[str], Field(None, description="Motivo da falha")]
+    started_at: Annotated[Optional[datetime], Field(None, description="Início da execução")]
+    finished_at: Annotated[Optional[datetime], Field(None, description="Fim da execução")]
@@ -0,0 +1,246 @@
+import asyncio
+import importlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import aliased, sessionmaker
+
+from workout_api.configs.database import create_engine
+from workout_api.configs.settings import settings
+from workout_api.jobs.models import JobModel
+from workout_api.jobs.registry import JOB_HANDLERS, JobContext
+
+logger = logging.getLogger('workout_api.jobs')
+
+# Módulos que registram handlers com @register_job
+HANDLER_MODULES = ('workout_api.atleta.jobs',)
+
+# Chave do advisory lock do Postgres que serializa as reservas de jobs entre processos
+CLAIM_LOCK_KEY = 0x6A6F6273
+
+
+def load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+class JobWorkerPool:
+    """Executa os jobs pendentes da tabela `jobs` com no máximo `concurrency` ao mesmo tempo.
+
+    O limite é global: vários processos podem rodar o pool (ex. um por worker do uvicorn), e
+    um job só é reservado enquanto há menos de `concurrency` jobs 'executando' na tabela. Cada
+    job é reservado com SELECT ... FOR UPDATE SKIP LOCKED seguido de um UPDATE condicional;
+    no Postgres as reservas são serializadas por um advisory lock da transação, para a
+    contagem enxergar as reservas dos outros processos.
+
+    Usa um engine próprio (pool do tamanho da concorrência, sem statement_timeout), então jobs
+    longos não ocupam as conexões das rotas CRUD.
+
+    Periodicamente o pool renova o heartbeat dos próprios jobs em execução e devolve para a
+    fila os jobs sem heartbeat há `stale_seconds` (de processos que morreram no meio).
+    """
+
+    def __init__(self, concurrency: int, poll_seconds: float, stale_seconds: float, shutdown_timeout: float):
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.shutdown_timeout = shutdown_timeout
+        self.engine: Optional[AsyncEngine] = None
+        self.session_factory: Optional[sessionmaker] = None
+        self._workers: list[asyncio.Task] = []
+        self._reaper: Optional[asyncio.Task] = None
+        self._executando: set[Any] = set()
+        self._interrompidos: set[Any] = set()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        load_handlers()
+        self.engine = create_engine(
+            settings.DB_URL, pool_size=self.concurrency, max_overflow=1, statement_timeout_ms=0
+        )
+        self.session_factory = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        self._stopping = False
+        await self._requeue_stale()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f'job-worker-{numero}') for numero in range(self.concurrency)
+        ]
+        self._reaper = asyncio.create_task(self._reap(), name='job-reaper')
+        logger.info('Pool de jobs iniciado com %d workers', self.concurrency)
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._reaper.cancel()
+        await asyncio.gather(self._reaper, return_exceptions=True)
+        self._reaper = None
+        # Jobs que não terminam no prazo são cancelados e voltam para a fila
+        _, pendentes = await asyncio.wait(self._workers, timeout=self.shutdown_timeout)
+        for task in pendentes:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._interrompidos:
+            # Só depois de todos os workers pararem, quando as sessões dos jobs já foram liberadas
+            await self._requeue(self._interrompidos)
+            self._interrompidos.clear()
+        await self.engine.dispose()
+        logger.info('Pool de jobs encerrado')
+
+    def notify(self) -> None:
+        """Acorda os workers ociosos (job submetido neste processo)."""
+        self._wakeup.set()
+
+    async def _reap(self) -> None:
+        # Sem isso, jobs de um processo que morreu só voltariam para a fila no próximo start
+        intervalo = max(self.stale_seconds / 2, self.poll_seconds)
+        while True:
+            await asyncio.sleep(intervalo)
+            try:
+                await self._heartbeat()
+                await self._requeue_stale()
+            except Exception:
+                logger.exception('Falha ao verificar jobs abandonados')
+
+    async def _heartbeat(self) -> None:
+        # Jobs longos que não reportam progresso continuam vivos enquanto este processo roda
+        if not self._executando:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                update(JobModel)
+                .where(JobModel.id.in_(self._executando), JobModel.status == 'executando')
+                .values(updated_at=datetime.utcnow())
+            )
+            await session.commit()
+
+    async def _requeue_stale(self) -> None:
+        # Jobs de processos que morreram no meio da execução
+        limite = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(JobModel)
+                .where(JobModel.status == 'executando', JobModel.updated_at < limite)
+                .values(status='pendente', updated_at=datetime.utcnow())
+            )
+            await session.commit()
+        if result.rowcount:
+            logger.warning('%d job(s) abandonados voltaram para a fila', result.rowcount)
+
+    async def _requeue(self, job_ids: set[Any]) -> None:
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(JobModel)
+                    .where(JobModel.id.in_(job_ids), JobModel.status == 'executando')
+                    .values(status='pendente', started_at=None, updated_at=datetime.utcnow())
+                )
+                await session.commit()
+            logger.warning('%d job(s) interrompidos voltaram para a fila', len(job_ids))
+        except Exception:
+            # Ficam para o _requeue_stale de outro pool, após JOBS_STALE_SECONDS
+            logger.exception('Falha ao devolver jobs interrompidos para a fila')
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            try:
+                job = await self._claim()
+            except Exception:
+                logger.exception('Falha ao buscar job pendente')
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            try:
+                await self._execute(*job)
+            except Exception:
+                # O job fica 'executando' sem heartbeat e volta para a fila após JOBS_STALE_SECONDS
+                logger.exception('Falha ao registrar o resultado do job %s', job[0])
+
+    async def _claim(self) -> Optional[tuple[Any, str, dict[str, Any]]]:
+        async with self.session_factory() as session:
+            if session.get_bind().dialect.name == 'postgresql':
+                # Liberado no commit/rollback; sem ele duas reservas simultâneas não se veem na contagem
+                await session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+            job_id = (await session.execute(
+                select(JobModel.id)
+                .where(JobModel.status == 'pendente')
+                .order_by(JobModel.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )).scalar()
+            if job_id is None:
+                return None
+
+            agora = datetime.utcnow()
+            executando = aliased(JobModel)
+            # O status no WHERE impede que dois workers peguem o mesmo job em bancos sem SKIP LOCKED;
+            # a contagem aplica o limite de concorrência somando todos os processos
+            job = (await session.execute(
+                update(JobModel)
+                .where(
+                    JobModel.id == job_id,
+                    JobModel.status == 'pendente',
+                    select(func.count()).select_from(executando)
+                    .where(executando.status == 'executando')
+                    .scalar_subquery() < self.concurrency,
+                )
+                .values(status='executando', started_at=agora, updated_at=agora)
+                .returning(JobModel.id, JobModel.tipo, JobModel.params)
+            )).first()
+            await session.commit()
+            return tuple(job) if job else None
+
+    async def _execute(self, job_id: Any, tipo: str, params: dict[str, Any]) -> None:
+        valores: dict[str, Any]
+        self._executando.add(job_id)
+        try:
+            try:
+                spec = JOB_HANDLERS[tipo]
+                context = JobContext(job_id=job_id, session_factory=self.session_factory)
+                resultado = await spec.handler(context, spec.params_schema.model_validate(params))
+                valores = {'status': 'concluido', 'resultado': resultado}
+            except Exception as exc:
+                logger.exception('Job %s (%s) falhou', job_id, tipo)
+                valores = {'status': 'erro', 'erro': f'{type(exc).__name__}: {exc}'}
+
+            valores['finished_at'] = datetime.utcnow()
+            await self._finish(job_id, valores)
+        except asyncio.CancelledError:
+            # Cancelado pelo stop(): volta para a fila depois que todos os workers pararem
+            self._interrompidos.add(job_id)
+            raise
+        finally:
+            self._executando.discard(job_id)
+
+    async def _finish(self, job_id: Any, valores: dict[str, Any]) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(JobModel).where(JobModel.id == job_id).values(updated_at=datetime.utcnow(), **valores)
+            )
+            await session.commit()
+
+
+job_pool = JobWorkerPool(
+    concurrency=settings.JOBS_CONCURRENCY,
+    poll_seconds=settings.JOBS_POLL_SECONDS,
+    stale_seconds=settings.JOBS_STALE_SECONDS,
+    shutdown_timeout=settings.JOBS_SHUTDOWN_TIMEOUT,
+)
@@ -1,9 +1,33 @@
-import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from workout_api.atleta.controller import api_router as atleta_router
 from workout_api.categorias.controller import api_router as categoria_router
 from workout_api.centro_treinamento.controller import api_router as centro_treinamento_router
+from workout_api.estatisticas.controller import api_router as estatisticas_router
+from workout_api.jobs.controller import api_router as jobs_router
+from workout_api.jobs.worker import job_pool
+from workout_api.configs.settings import settings
+from workout_api.configs.database import engine, pool_status, read_router, start_engines, stop_engines
+from workout_api.contrib.cache import cache_stats
+from workout_api.contrib.compression import CompressionMiddleware
+from workout_api.contrib.dependencies import db_limiter
+from workout_api.contrib.health import create_readiness_check
+from workout_api.contrib.metrics import MetricsMiddleware, render_metrics, render_samples
+from workout_api.contrib.rate_limit import MemoryRateLimitBackend, RateLimit, RateLimitMiddleware, RateLimitRule
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pool de conexões próprio deste processo, já aquecido
+    await start_engines()
+    # Workers de jobs rodam neste processo, a menos que estejam em um processo próprio
+    if settings.JOBS_ENABLED:
+        await job_pool.start()
+    yield
+    # O uvicorn só chega aqui depois de drenar as requisições em andamento
+    await job_pool.stop()
+    await stop_engines()
 
 # Configuração da aplicação
 app = FastAPI(
@@ -11,9 +35,41 @@ app = FastAPI(
     description="API para gerenciamento de treinos e atletas",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Rate limit por cliente; rotas caras têm orçamento próprio, menor que o padrão
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_CLIENTS),
+        default=RateLimit(settings.RATE_LIMIT_PER_SECOND, settings.RATE_LIMIT_BURST),
+        rules=(
+            RateLimitRule("GET", "/atleta/export", RateLimit(rate=0.2, burst=2)),
+            RateLimitRule("POST", "/atleta/bulk", RateLimit(rate=1, burst=5)),
+            RateLimitRule("PATCH", "/atleta/bulk", RateLimit(rate=1, burst=5)),
+            RateLimitRule("POST", "/atleta/bulk-delete", RateLimit(rate=1, burst=5)),
+            RateLimitRule("POST", "/jobs/", RateLimit(rate=0.5, burst=5)),
+            RateLimitRule("GET", "/atleta/search", RateLimit(rate=5, burst=10)),
+        ),
+        exempt=("/health", "/metrics"),
+    )
+
+# Compressão negociada pelo Accept-Encoding; fica dentro do MetricsMiddleware, que mede os bytes enviados
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=tuple(nome.strip() for nome in settings.COMPRESSION_ENCODINGS.split(",") if nome.strip()),
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_LEVEL,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        },
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    )
+
 # Configuração CORS
 app.add_middleware(
     CORSMiddleware,
@@ -23,10 +79,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas por rota (latência, tamanho da resposta, statements SQL) expostas em /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Incluir todos os routers
 app.include_router(atleta_router, prefix="/atleta", tags=["atleta"])
 app.include_router(categoria_router, prefix="/categoria", tags=["categoria"])
 app.include_router(centro_treinamento_router, prefix="/centro_treinamento", tags=["centro_treinamento"])
+app.include_router(estatisticas_router, prefix="/stats", tags=["stats"])
+app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 
 # Endpoint de health check
 @app.get("/health")
@@ -34,6 +95,71 @@ async def health_check():
     """Endpoint para verificar se a API está funcionando"""
     return {"status": "healthy", "message": "Workout API is running!"}
 
+# Liveness: o processo responde, sem tocar no banco
+@app.get("/health/live")
+async def health_live():
+    """Probe de liveness do orquestrador"""
+    return {"status": "alive"}
+
+readiness_check = create_readiness_check(engine)
+
+# Readiness: banco respondendo pelo pool (resultado reaproveitado por HEALTH_CACHE_SECONDS)
+@app.get("/health/ready")
+async def health_ready():
+    """Probe de readiness: SELECT 1 cronometrado e saturação do pool"""
+    result, cached = await readiness_check.check()
+    return JSONResponse(
+        {**result.body, "cached": cached},
+        status_code=200 if result.ready else 503,
+    )
+
+# Estatísticas do pool de conexões com o banco
+@app.get("/db/pool")
+async def db_pool_status():
+    """Conexões em uso, overflow e tempo de espera por conexão do pool"""
+    return {
+        "primary": pool_status(engine),
+        "replicas": [
+            {**pool_status(read_engine), "healthy": read_router.is_healthy(index)}
+            for index, read_engine in enumerate(read_router.engines)
+        ],
+    }
+
+# Estatísticas do cache de categorias e centros de treinamento
+@app.get("/cache/stats")
+async def cache_stats_endpoint():
+    """Hits, misses e ocupação do cache de entidades de referência"""
+    return cache_stats()
+
+# Métricas no formato texto do Prometheus
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Métricas HTTP/SQL por rota, estado do pool e do cache"""
+    pools = {("primary",): pool_status(engine)}
+    for index, read_engine in enumerate(read_router.engines):
+        pools[(f"replica_{index}",)] = pool_status(read_engine)
+    caches = cache_stats()
+
+    extra = []
+    for campo, counter in (("checked_out", False), ("overflow", False), ("timeouts", True)):
+        extra += render_samples(
+            f"db_pool_{campo}", f"Pool de conexões: {campo}", ("pool",),
+            {labels: status[campo] for labels, status in pools.items()}, counter,
+        )
+    extra += render_samples(
+        "db_limiter_active", "Requisições usando o banco neste processo", (), {(): db_limiter.active},
+    )
+    extra += render_samples(
+        "db_limiter_rejected", "Requisições recusadas por falta de vaga no banco", ("limite",),
+        {(limite,): total for limite, total in db_limiter.rejected.items()}, True,
+    )
+    for campo, counter in (("hits", True), ("misses", True), ("size", False)):
+        extra += render_samples(
+            f"reference_cache_{campo}", f"Cache de entidades de referência: {campo}", ("cache",),
+            {(nome,): stats[campo] for nome, stats in caches.items()}, counter,
+        )
+    return PlainTextResponse(render_metrics(extra), media_type="text/plain; version=0.0.4")
+
 # Rotas principais da aplicação
 @app.get("/")
 async def root():
@@ -45,16 +171,7 @@ async def root():
     }
 
 if __name__ == "__main__":
-    import uvicorn
-    
-    host = os.getenv("API_HOST", "0.0.0.0")
-    port = int(os.getenv("API_PORT", "8000"))
-    reload = os.getenv("API_RELOAD", "true").lower() == "true"
-    
-    uvicorn.run(
-        "main:app",
-        host=host,
-        port=port,
-        log_level="info",
-        reload=reload
-    )
\ No newline at end of file
+    # Mesmo que python -m workout_api.server (API_WORKERS, API_RELOAD etc. nas settings)
+    from workout_api.server import run
+
+    run()
@@ -0,0 +1,63 @@
+"""Servidor de produção da Workout API.
+
+    python -m workout_api.server
+
+Sobe API_WORKERS processos do uvicorn (um por núcleo por padrão), com uvloop e httptools
+quando instalados (uvicorn[standard]). Cada worker cria o próprio pool de conexões no
+startup do lifespan e o fecha no shutdown, depois de esperar as requisições em andamento
+por até API_GRACEFUL_SHUTDOWN_SECONDS. Cada worker abre até DB_POOL_SIZE + DB_MAX_OVERFLOW
+conexões, então o total no banco é API_WORKERS vezes isso.
+
+Atrás de um proxy reverso, API_FORWARDED_ALLOW_IPS precisa incluir o endereço dele; senão
+todas as requisições têm o IP do proxy e os limites por cliente viram limites globais.
+
+Os logs da aplicação (loggers workout_api.*, como o de SQL lento) são configurados aqui, no
+log_config que o uvicorn aplica em cada worker; importar workout_api.main não mexe no logging.
+"""
+import copy
+import importlib.util
+import os
+
+import uvicorn
+
+from workout_api.configs.settings import settings
+
+APP = 'workout_api.main:app'
+
+
+def log_config() -> dict:
+    """Configuração padrão do uvicorn com um handler próprio para os loggers workout_api.*."""
+    config = copy.deepcopy(uvicorn.config.LOGGING_CONFIG)
+    config['formatters']['workout_api'] = {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'}
+    config['handlers']['workout_api'] = {
+        'formatter': 'workout_api', 'class': 'logging.StreamHandler', 'stream': 'ext://sys.stderr',
+    }
+    config['loggers']['workout_api'] = {'handlers': ['workout_api'], 'level': 'INFO', 'propagate': False}
+    return config
+
+
+def _disponivel(modulo: str) -> bool:
+    return importlib.util.find_spec(modulo) is not None
+
+
+def run() -> None:
+    # reload só funciona com um processo
+    workers = 1 if settings.API_RELOAD else (settings.API_WORKERS or os.cpu_count() or 1)
+    uvicorn.run(
+        APP,
+        host=settings.API_HOST,
+        port=settings.API_PORT,
+        workers=workers,
+        reload=settings.API_RELOAD,
+        loop='uvloop' if _disponivel('uvloop') else 'asyncio',
+        http='httptools' if _disponivel('httptools') else 'h11',
+        timeout_graceful_shutdown=settings.API_GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.API_FORWARDED_ALLOW_IPS,
+        log_level='info',
+        log_config=log_config(),
+    )
+
+
+if __name__ == '__main__':
+    run()